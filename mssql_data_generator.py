@@ -18,12 +18,19 @@
 import pymssql
 import random
 import string
-from decimal import Decimal
 from datetime import datetime, date, timedelta, time
 import uuid
 import json
 import ipaddress
+import multiprocessing
+import functools
+import os
 import sys
+import queue
+import threading
+from collections import deque
+from itertools import islice
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 
 # -------------------------------------------------------------------------------------
 # Shared helpers
@@ -35,14 +42,28 @@ PLANTS = ['US-PLANT-01','GER-PLANT-02','JP-PLANT-03','CN-PLANT-04','IN-PLANT-05'
 TIMEZONES = ['UTC','US/Eastern','Europe/Berlin','Asia/Tokyo','Asia/Shanghai',
              'Asia/Kolkata','Australia/Sydney']
 
+ALNUM = string.ascii_letters + string.digits
+
+def coin():
+    # Single C-level draw for a 50/50 BIT column
+    return random.getrandbits(1)
+
 def rand_str(n=8):
-    return ''.join(random.choices(string.ascii_letters + string.digits, k=n))
+    return ''.join(random.choices(ALNUM, k=n))
 
 def rand_ipv4():
     return str(ipaddress.IPv4Address(random.randint(0x0A000001, 0x0AFFFFFF)))
 
 def rand_mac():
-    return ':'.join(f'{random.randint(0,255):02x}' for _ in range(6))
+    return random.getrandbits(48).to_bytes(6, 'big').hex(':')
+
+def rand_uuid():
+    # Version-4 UUID from the Mersenne Twister: no /dev/urandom read per row
+    return str(uuid.UUID(int=random.getrandbits(128), version=4))
+
+# Compact encoder built once: skips json.dumps' per-call option handling and
+# drops the padding spaces from every JSON column
+dump_json = json.JSONEncoder(separators=(',', ':')).encode
 
 def rand_semver():
     return f"{random.randint(0,9)}.{random.randint(0,99)}.{random.randint(0,999)}"
@@ -74,7 +95,7 @@ INVOICES_DDL = """
 IF NOT EXISTS (SELECT * FROM sysobjects WHERE name='invoices' AND xtype='U')
 CREATE TABLE invoices (
     invoice_id          INT IDENTITY(1,1) PRIMARY KEY,
-    invoice_number      NVARCHAR(50) UNIQUE NOT NULL,
+    invoice_number      NVARCHAR(50) NOT NULL,
     customer_id         INT NOT NULL,
     customer_code       NVARCHAR(20) NOT NULL,
     customer_name       NVARCHAR(255) NOT NULL,
@@ -122,16 +143,20 @@ CREATE TABLE invoices (
     cost_center         NVARCHAR(20),
     manufacturing_plant NVARCHAR(50),
     quality_check_passed BIT,
-    compliance_verified  BIT,
-
-    CONSTRAINT CHK_inv_total  CHECK (total_amount >= 0),
-    CONSTRAINT CHK_inv_tax    CHECK (tax_amount >= 0),
-    CONSTRAINT CHK_inv_disc   CHECK (discount_amount >= 0)
+    compliance_verified  BIT
 )
 """
 
+# Added after the load so rows go into the table without per-row uniqueness/check work
+INVOICES_IDX = [
+    "ALTER TABLE invoices ADD CONSTRAINT UQ_inv_number UNIQUE (invoice_number)",
+    "ALTER TABLE invoices ADD CONSTRAINT CHK_inv_total CHECK (total_amount >= 0)",
+    "ALTER TABLE invoices ADD CONSTRAINT CHK_inv_tax   CHECK (tax_amount >= 0)",
+    "ALTER TABLE invoices ADD CONSTRAINT CHK_inv_disc  CHECK (discount_amount >= 0)",
+]
+
 INVOICES_INSERT = """
-INSERT INTO invoices (
+INSERT INTO invoices WITH (TABLOCK) (
     invoice_number, customer_id, customer_code, customer_name, customer_address,
     billing_country, shipping_country, currency_code, payment_terms, sales_representative,
     total_amount, tax_amount, discount_amount, shipping_cost, subtotal_amount,
@@ -146,58 +171,61 @@ INSERT INTO invoices (
 )
 """
 
-def gen_invoice(idx):
-    billing = random.choice(COUNTRIES)
-    shipping = random.choice(COUNTRIES)
-    items_count = random.randint(1, 15)
-    items, subtotal = [], Decimal('0.00')
-    for j in range(items_count):
-        up = Decimal(str(round(random.uniform(10, 1000), 2)))
-        qty = random.randint(1, 50)
-        total = up * qty
-        items.append({
-            'item_id': j+1, 'product_code': f"PROD-{random.randint(1000,9999)}",
-            'description': f'Part {random.randint(100,999)}', 'quantity': qty,
-            'unit_price': float(up), 'total_amount': float(total),
-            'uom': random.choice(['PCS','KG','M','L'])
-        })
-        subtotal += total
-
-    discount = Decimal(str(round(random.uniform(0, min(float(subtotal*Decimal('0.2')), 500)), 2)))
-    ship_cost = Decimal(str(round(random.uniform(0, 200), 2)))
-    tax_rate = round(random.uniform(0.05, 0.25), 3)
-    tax_amt = (subtotal - discount) * Decimal(str(tax_rate))
+# Choice pools are module constants so rows don't rebuild list literals per call
+UOMS = ['PCS','KG','M','L']
+PAYMENT_TERMS = ['NET30','NET60','DUE_ON_RECEIPT','NET15']
+INVOICE_STATUSES = ['DRAFT','SENT','PAID','OVERDUE','CANCELLED']
+
+def gen_invoice(idx: int, now: datetime, _choice=random.choice, _randint=random.randint,
+                _uniform=random.uniform) -> tuple:
+    billing = _choice(COUNTRIES)
+    shipping = _choice(COUNTRIES)
+    items_count = _randint(1, 15)
+    # Money is kept in integer cents: exact like Decimal, but plain int arithmetic
+    lines = [(_randint(1000, 100000), _randint(1, 50)) for _ in range(items_count)]
+    subtotal = sum(up * qty for up, qty in lines)
+    items = [{
+        'item_id': j, 'product_code': f"PROD-{_randint(1000,9999)}",
+        'description': f'Part {_randint(100,999)}', 'quantity': qty,
+        'unit_price': up / 100, 'total_amount': up * qty / 100,
+        'uom': _choice(UOMS)
+    } for j, (up, qty) in enumerate(lines, 1)]
+
+    discount = _randint(0, min(subtotal // 5, 50000))
+    ship_cost = _randint(0, 20000)
+    tax_rate = round(_uniform(0.05, 0.25), 3)
+    tax_amt = round((subtotal - discount) * tax_rate)
     total_amt = subtotal - discount + tax_amt + ship_cost
 
-    base_dt = date.today() - timedelta(days=random.randint(0, 365))
-    created = datetime.now() - timedelta(days=random.randint(0, 30))
-    pay_dt = created - timedelta(days=random.randint(1,15)) if random.random() > 0.5 else None
-    ship_dt = created - timedelta(days=random.randint(1,10)) if random.random() > 0.5 else None
-    appr_dt = created - timedelta(days=random.randint(1,5)) if random.random() > 0.5 else None
+    base_dt = now.date() - timedelta(days=_randint(0, 365))
+    created = now - timedelta(days=_randint(0, 30))
+    pay_dt = created - timedelta(days=_randint(1,15)) if coin() else None
+    ship_dt = created - timedelta(days=_randint(1,10)) if coin() else None
+    appr_dt = created - timedelta(days=_randint(1,5)) if coin() else None
 
     return (
-        f"INV-{date.today().strftime('%Y%m')}-{idx+1:06d}",
-        random.randint(1000,9999), f"CUST-{random.randint(10000,99999)}",
-        f"Customer {random.randint(1,1000)} Corp.",
-        f"{random.randint(1,9999)} Main St, City {random.randint(1,100)}, {billing}",
-        billing, shipping, random.choice(CURRENCIES),
-        random.choice(['NET30','NET60','DUE_ON_RECEIPT','NET15']),
-        f"SalesRep-{random.randint(1,50)}",
-        float(total_amt), float(tax_amt), float(discount), float(ship_cost), float(subtotal),
-        items_count, random.randint(0,5), random.randint(1,10),
-        round(random.uniform(0.8,1.2), 4), tax_rate,
-        1 if random.random()>0.5 else 0, 1 if random.random()>0.5 else 0,
-        1 if random.random()>0.5 else 0, 1 if random.random()>0.5 else 0,
+        f"INV-{now:%Y%m}-{idx+1:06d}",
+        _randint(1000,9999), f"CUST-{_randint(10000,99999)}",
+        f"Customer {_randint(1,1000)} Corp.",
+        f"{_randint(1,9999)} Main St, City {_randint(1,100)}, {billing}",
+        billing, shipping, _choice(CURRENCIES),
+        _choice(PAYMENT_TERMS),
+        f"SalesRep-{_randint(1,50)}",
+        total_amt / 100, tax_amt / 100, discount / 100, ship_cost / 100, subtotal / 100,
+        items_count, _randint(0,5), _randint(1,10),
+        round(_uniform(0.8,1.2), 4), tax_rate,
+        coin(), coin(),
+        coin(), coin(),
         1 if billing != shipping else 0,
-        base_dt, base_dt + timedelta(days=random.randint(15,90)),
+        base_dt, base_dt + timedelta(days=_randint(15,90)),
         created, pay_dt, ship_dt, appr_dt,
-        random.choice(TIMEZONES), json.dumps(items),
-        bytes(random.getrandbits(8) for _ in range(64)),
-        json.dumps({'version':'1.0','batch_id': str(uuid.uuid4())}),
-        random.choice(['DRAFT','SENT','PAID','OVERDUE','CANCELLED']),
-        f"PROJ-{random.randint(1000,9999)}", f"CC-{random.randint(100,999)}",
-        random.choice(PLANTS),
-        1 if random.random()>0.5 else 0, 1 if random.random()>0.5 else 0
+        _choice(TIMEZONES), dump_json(items),
+        os.urandom(64),
+        dump_json({'version':'1.0','batch_id': rand_uuid()}),
+        _choice(INVOICE_STATUSES),
+        f"PROJ-{_randint(1000,9999)}", f"CC-{_randint(100,999)}",
+        _choice(PLANTS),
+        coin(), coin()
     )
 
 
@@ -209,7 +237,7 @@ IF NOT EXISTS (SELECT * FROM sysobjects WHERE name='employees' AND xtype='U')
 CREATE TABLE employees (
     employee_id         INT IDENTITY(1,1) PRIMARY KEY,
     employee_uuid       UNIQUEIDENTIFIER NOT NULL DEFAULT NEWID(),
-    employee_code       NVARCHAR(20) UNIQUE NOT NULL,
+    employee_code       NVARCHAR(20) NOT NULL,
     first_name          NVARCHAR(100) NOT NULL,
     last_name           NVARCHAR(100) NOT NULL,
     email               NVARCHAR(255) NOT NULL,
@@ -256,14 +284,17 @@ CREATE TABLE employees (
 
     profile_photo_thumb VARBINARY(MAX),
     bio                 NVARCHAR(MAX),
-    notes               NVARCHAR(MAX),
-
-    CONSTRAINT CHK_emp_salary CHECK (base_salary >= 0)
+    notes               NVARCHAR(MAX)
 )
 """
 
+EMPLOYEES_IDX = [
+    "ALTER TABLE employees ADD CONSTRAINT UQ_emp_code UNIQUE (employee_code)",
+    "ALTER TABLE employees ADD CONSTRAINT CHK_emp_salary CHECK (base_salary >= 0)",
+]
+
 EMPLOYEES_INSERT = """
-INSERT INTO employees (
+INSERT INTO employees WITH (TABLOCK) (
     employee_uuid, employee_code, first_name, last_name, email, phone_number,
     gender, employment_type, department, job_title, job_level,
     base_salary, bonus_pct, stock_options, years_experience, employee_rating, badge_number,
@@ -290,49 +321,57 @@ JOB_TITLES = ['Software Engineer','Analyst','Manager','Director','VP','Intern','
 SKILLS_POOL = ['Python','Java','SQL','AWS','Docker','Kubernetes','React','TypeScript','Go','Rust',
                'Terraform','CI/CD','Machine Learning','Data Engineering','Kafka','Spark']
 CERTS_POOL = ['AWS-SAA','AWS-SAP','CKA','PMP','CISSP','TOGAF','AZ-900','GCP-ACE','CKAD','OCP']
-
-def gen_employee(idx):
-    fn = random.choice(FIRST_NAMES)
-    ln = random.choice(LAST_NAMES)
-    dob = date(random.randint(1960,2002), random.randint(1,12), random.randint(1,28))
-    hire = date(random.randint(2010,2025), random.randint(1,12), random.randint(1,28))
-    term = hire + timedelta(days=random.randint(180,1800)) if random.random() < 0.15 else None
+GENDERS = ['Male','Female','Non-Binary','Prefer Not to Say']
+EMPLOYMENT_TYPES = ['Full-Time','Part-Time','Contract','Intern']
+PROBATION_PERIODS = ['3 months','6 months']
+ADDRESS_CITIES = ['Tokyo','Berlin','Mumbai','NYC']
+THEMES = ['dark','light']
+LANGUAGES = ['en','de','ja','hi']
+
+def gen_employee(idx: int, now: datetime, _choice=random.choice, _randint=random.randint,
+                 _uniform=random.uniform, _random=random.random,
+                 _sample=random.sample) -> tuple:
+    fn = _choice(FIRST_NAMES)
+    ln = _choice(LAST_NAMES)
+    dob = date(_randint(1960,2002), _randint(1,12), _randint(1,28))
+    hire = date(_randint(2010,2025), _randint(1,12), _randint(1,28))
+    term = hire + timedelta(days=_randint(180,1800)) if _random() < 0.15 else None
 
     return (
-        str(uuid.uuid4()), f"EMP-{idx+1:06d}", fn, ln,
-        f"{fn.lower()}.{ln.lower()}{random.randint(1,99)}@example.com",
-        f"+{random.randint(1,99)}-{random.randint(100,999)}-{random.randint(1000,9999)}",
-        random.choice(['Male','Female','Non-Binary','Prefer Not to Say']),
-        random.choice(['Full-Time','Part-Time','Contract','Intern']),
-        random.choice(DEPARTMENTS), random.choice(JOB_TITLES),
-        random.randint(1, 10),                              # TINYINT (0-255)
-        round(random.uniform(30000,250000), 2),             # MONEY
-        round(random.uniform(0,0.30), 4),
-        random.randint(0,50000), random.randint(0,35),
-        round(random.uniform(1.0,5.0), 6), random.randint(100000,999999),
-        1 if random.random()>0.5 else 0, 1 if random.random()>0.5 else 0,
-        1 if random.random()>0.5 else 0,
-        1 if random.random()>0.3 else (0 if random.random()>0.5 else None),
+        rand_uuid(), f"EMP-{idx+1:06d}", fn, ln,
+        f"{fn.lower()}.{ln.lower()}{_randint(1,99)}@example.com",
+        f"+{_randint(1,99)}-{_randint(100,999)}-{_randint(1000,9999)}",
+        _choice(GENDERS),
+        _choice(EMPLOYMENT_TYPES),
+        _choice(DEPARTMENTS), _choice(JOB_TITLES),
+        _randint(1, 10),                              # TINYINT (0-255)
+        round(_uniform(30000,250000), 2),             # MONEY
+        round(_uniform(0,0.30), 4),
+        _randint(0,50000), _randint(0,35),
+        round(_uniform(1.0,5.0), 6), _randint(100000,999999),
+        coin(), coin(),
+        coin(),
+        1 if _random()>0.3 else (0 if coin() else None),
         dob, hire, term,
-        time(random.randint(0,23), random.randint(0,59), random.randint(0,59)),
-        time(random.randint(6,10), 0, 0),
-        datetime.now() - timedelta(days=random.randint(0,30)),
-        datetime.now() - timedelta(days=random.randint(0,10)),
-        f"{random.choice([3,6])} months",
+        time(_randint(0,23), _randint(0,59), _randint(0,59)),
+        time(_randint(6,10), 0, 0),
+        now - timedelta(days=_randint(0,30)),
+        now - timedelta(days=_randint(0,10)),
+        _choice(PROBATION_PERIODS),
         rand_ipv4(), rand_mac(),
-        json.dumps(random.sample(SKILLS_POOL, k=random.randint(2,7))),
-        json.dumps(random.sample(CERTS_POOL, k=random.randint(0,4))),
-        json.dumps([random.randint(1000,9999) for _ in range(random.randint(1,5))]),
-        json.dumps({'street': f"{random.randint(1,9999)} Oak St",
-                    'city': random.choice(['Tokyo','Berlin','Mumbai','NYC']),
-                    'country': random.choice(COUNTRIES)}),
-        json.dumps({'name': f"{random.choice(FIRST_NAMES)} {random.choice(LAST_NAMES)}",
-                    'phone': f"+1-555-{random.randint(1000,9999)}"}),
-        json.dumps({'theme': random.choice(['dark','light']),
-                    'language': random.choice(['en','de','ja','hi'])}),
-        bytes(random.getrandbits(8) for _ in range(128)),
-        f"Experienced {random.choice(JOB_TITLES).lower()} with {random.randint(1,20)} years.",
-        f"Note: {rand_str(50)}" if random.random() > 0.5 else None
+        dump_json(_sample(SKILLS_POOL, k=_randint(2,7))),
+        dump_json(_sample(CERTS_POOL, k=_randint(0,4))),
+        dump_json([_randint(1000,9999) for _ in range(_randint(1,5))]),
+        dump_json({'street': f"{_randint(1,9999)} Oak St",
+                    'city': _choice(ADDRESS_CITIES),
+                    'country': _choice(COUNTRIES)}),
+        dump_json({'name': f"{_choice(FIRST_NAMES)} {_choice(LAST_NAMES)}",
+                    'phone': f"+1-555-{_randint(1000,9999)}"}),
+        dump_json({'theme': _choice(THEMES),
+                    'language': _choice(LANGUAGES)}),
+        os.urandom(128),
+        f"Experienced {_choice(JOB_TITLES).lower()} with {_randint(1,20)} years.",
+        f"Note: {rand_str(50)}" if coin() else None
     )
 
 
@@ -387,7 +426,7 @@ CREATE TABLE sensor_readings (
 """
 
 SENSOR_INSERT = """
-INSERT INTO sensor_readings (
+INSERT INTO sensor_readings WITH (TABLOCK) (
     reading_uuid, device_id, device_serial, firmware_version,
     temperature_c, humidity_pct, pressure_hpa, voltage, current_amps, power_watts,
     latitude, longitude, altitude_m, signal_strength_dbm, error_code, uptime_seconds,
@@ -405,39 +444,48 @@ INSERT INTO sensor_readings (
 
 SENSOR_LOCATIONS = ['Factory Floor A','Warehouse B','Server Room C','Outdoor Station D',
                     'Cold Storage E','Lab Room F','Rooftop G','Basement H']
-
-def gen_sensor_reading(idx):
-    ts = datetime.now() - timedelta(days=random.randint(0,90), hours=random.randint(0,23),
-                                     minutes=random.randint(0,59), seconds=random.randint(0,59))
+SENSOR_LABELS = ['temp','humidity','pressure','vibration']
+SENSOR_MANUFACTURERS = ['Bosch','Siemens','Honeywell']
+SENSOR_ERROR_CODES = [0,0,0,1,2,99]                         # mostly 0
+TAG_IDS = range(1, 501)
+READING_WINDOW_SECONDS = 91 * 86400                         # readings span the last ~90 days
+
+def gen_sensor_reading(idx: int, now: datetime, _choice=random.choice, _randint=random.randint,
+                       _uniform=random.uniform, _random=random.random,
+                       _sample=random.sample, _choices=random.choices,
+                       _randrange=random.randrange) -> tuple:
+    # One draw over the whole window is equivalent to separate day/hour/minute/second draws
+    ts = now - timedelta(seconds=_randrange(READING_WINDOW_SECONDS))
     return (
-        str(uuid.uuid4()), f"DEV-{random.randint(1,200):04d}",
+        rand_uuid(), f"DEV-{_randint(1,200):04d}",
         rand_str(16).upper(), rand_semver(),
-        float(round(random.uniform(-40,85), 4)),
-        float(round(random.uniform(0,100), 3)),
-        float(round(random.uniform(900,1100), 4)),
-        round(random.uniform(0,48), 3), round(random.uniform(0,10), 8),
-        float(round(random.uniform(0,5000), 6)),
-        float(round(random.uniform(-90,90), 7)),
-        float(round(random.uniform(-180,180), 7)),
-        round(random.uniform(-50,5000), 2),
-        random.randint(-120,0), random.choice([0,0,0,1,2,99]),
-        random.randint(0, 10_000_000),
-        round(random.uniform(10, 200), 4),                  # SMALLMONEY
-        1 if random.random() < 0.05 else 0,
-        0 if random.random() < 0.02 else 1,
-        1 if random.random() < 0.1 else 0,
-        ts, ts + timedelta(milliseconds=random.randint(50,2000)),
+        round(_uniform(-40,85), 4),
+        round(_uniform(0,100), 3),
+        round(_uniform(900,1100), 4),
+        round(_uniform(0,48), 3), round(_uniform(0,10), 8),
+        round(_uniform(0,5000), 6),
+        round(_uniform(-90,90), 7),
+        round(_uniform(-180,180), 7),
+        round(_uniform(-50,5000), 2),
+        _randint(-120,0), _choice(SENSOR_ERROR_CODES),
+        _randint(0, 10_000_000),
+        round(_uniform(10, 200), 4),                  # SMALLMONEY
+        1 if _random() < 0.05 else 0,
+        0 if _random() < 0.02 else 1,
+        1 if _random() < 0.1 else 0,
+        ts, ts + timedelta(milliseconds=_randint(50,2000)),
         ts.date(), ts.time(),
-        json.dumps([random.randint(1,500) for _ in range(random.randint(1,5))]),
-        json.dumps(random.sample(['temp','humidity','pressure','vibration'], k=random.randint(1,3))),
-        json.dumps([round(random.uniform(-50,150), 6) for _ in range(random.randint(5,20))]),
-        json.dumps({'manufacturer': random.choice(['Bosch','Siemens','Honeywell']),
-                    'model': f"M{random.randint(100,999)}"}),
-        json.dumps({'temp_high': round(random.uniform(50,80), 1)}),
-        bytes(random.getrandbits(8) for _ in range(random.randint(32,256))),
-        bytes(random.getrandbits(8) for _ in range(32)),     # BINARY(32) fixed
-        random.choice(SENSOR_LOCATIONS),
-        f"Reading #{idx+1}" if random.random() > 0.7 else None
+        dump_json(_choices(TAG_IDS, k=_randint(1,5))),
+        dump_json(_sample(SENSOR_LABELS, k=_randint(1,3))),
+        # random() scaled inline: uniform() is a Python-level call per sample
+        dump_json([round(-50 + 200 * _random(), 6) for _ in range(_randint(5,20))]),
+        dump_json({'manufacturer': _choice(SENSOR_MANUFACTURERS),
+                    'model': f"M{_randint(100,999)}"}),
+        dump_json({'temp_high': round(_uniform(50,80), 1)}),
+        os.urandom(_randint(32,256)),
+        os.urandom(32),                                     # BINARY(32) fixed
+        _choice(SENSOR_LOCATIONS),
+        f"Reading #{idx+1}" if _random() > 0.7 else None
     )
 
 
@@ -449,7 +497,7 @@ IF NOT EXISTS (SELECT * FROM sysobjects WHERE name='product_catalog' AND xtype='
 CREATE TABLE product_catalog (
     product_id          INT IDENTITY(1,1) PRIMARY KEY,
     product_uuid        UNIQUEIDENTIFIER NOT NULL DEFAULT NEWID(),
-    sku                 NVARCHAR(40) UNIQUE NOT NULL,
+    sku                 NVARCHAR(40) NOT NULL,
     product_name        NVARCHAR(300) NOT NULL,
     category            NVARCHAR(100) NOT NULL,
     subcategory         NVARCHAR(100),
@@ -499,15 +547,18 @@ CREATE TABLE product_catalog (
     thumbnail_blob      VARBINARY(MAX),
     internal_notes      NVARCHAR(MAX),
     country_of_origin   NVARCHAR(100),
-    hs_tariff_code      NVARCHAR(20),
-
-    CONSTRAINT CHK_cat_price CHECK (unit_price >= 0),
-    CONSTRAINT CHK_cat_stock CHECK (stock_quantity >= 0)
+    hs_tariff_code      NVARCHAR(20)
 )
 """
 
+CATALOG_IDX = [
+    "ALTER TABLE product_catalog ADD CONSTRAINT UQ_cat_sku UNIQUE (sku)",
+    "ALTER TABLE product_catalog ADD CONSTRAINT CHK_cat_price CHECK (unit_price >= 0)",
+    "ALTER TABLE product_catalog ADD CONSTRAINT CHK_cat_stock CHECK (stock_quantity >= 0)",
+]
+
 CATALOG_INSERT = """
-INSERT INTO product_catalog (
+INSERT INTO product_catalog WITH (TABLOCK) (
     product_uuid, sku, product_name, category, subcategory, brand,
     description_short, description_long,
     unit_price, wholesale_price, cost_price,
@@ -535,52 +586,72 @@ CATEGORIES = {
 }
 BRANDS = ['Bosch','3M','Siemens','ABB','Schneider','Honeywell','TE Connectivity','Parker']
 COLORS = ['Red','Blue','Green','Black','White','Silver','Yellow','Orange','Gray']
+CATEGORY_NAMES = list(CATEGORIES)
 
-def gen_product(idx):
-    cat = random.choice(list(CATEGORIES.keys()))
-    subcat = random.choice(CATEGORIES[cat])
-    brand = random.choice(BRANDS)
-    up = round(random.uniform(1,5000), 4)
-    ws = round(up * random.uniform(0.5,0.9), 4)
-    cp = round(ws * random.uniform(0.4,0.8), 4)
-    l, w, h = round(random.uniform(1,200),2), round(random.uniform(1,200),2), round(random.uniform(1,200),2)
-
-    launch = date(random.randint(2015,2025), random.randint(1,12), random.randint(1,28))
-    disc = launch + timedelta(days=random.randint(365,3650)) if random.random() < 0.1 else None
+# description_long repeats one sentence 3-10 times; the longest form of every
+# (subcategory, brand) pair is built once and rows take a prefix of it
+DESCRIPTION_SENTENCES = {
+    (subcat, brand): f"Detailed description for {subcat} product by {brand}. "
+    for subcats in CATEGORIES.values() for subcat in subcats for brand in BRANDS
+}
+DESCRIPTIONS = {key: (len(sentence), sentence * 10)
+                for key, sentence in DESCRIPTION_SENTENCES.items()}
+
+PRODUCT_LINES = ['Pro','Standard','Elite']
+PRODUCT_TAGS = ['industrial','premium','sale','new','eco','certified']
+MATERIALS = ['Steel','Aluminum','Plastic']
+IP_RATINGS = ['IP54','IP65','IP67','IP68']
+SHIP_CLASSES = ['Standard','Oversize','Hazmat']
+MARGIN_TIERS = ['Margin tier A','Margin tier B','Margin tier C']
+
+def gen_product(idx: int, now: datetime, _choice=random.choice, _randint=random.randint,
+                _uniform=random.uniform, _random=random.random,
+                _sample=random.sample) -> tuple:
+    cat = _choice(CATEGORY_NAMES)
+    subcat = _choice(CATEGORIES[cat])
+    brand = _choice(BRANDS)
+    up = round(_uniform(1,5000), 4)
+    ws = round(up * _uniform(0.5,0.9), 4)
+    cp = round(ws * _uniform(0.4,0.8), 4)
+    l, w, h = round(_uniform(1,200),2), round(_uniform(1,200),2), round(_uniform(1,200),2)
+
+    launch = date(_randint(2015,2025), _randint(1,12), _randint(1,28))
+    disc = launch + timedelta(days=_randint(365,3650)) if _random() < 0.1 else None
+    sentence_len, description = DESCRIPTIONS[subcat, brand]
 
     return (
-        str(uuid.uuid4()), f"SKU-{cat[:3].upper()}-{idx+1:06d}",
-        f"{brand} {subcat} {random.choice(['Pro','Standard','Elite'])} {random.randint(100,999)}",
+        rand_uuid(), f"SKU-{cat[:3].upper()}-{idx+1:06d}",
+        f"{brand} {subcat} {_choice(PRODUCT_LINES)} {_randint(100,999)}",
         cat, subcat, brand,
         f"High-quality {subcat.lower()} for industrial use.",
-        f"Detailed description for {subcat} product by {brand}. " * random.randint(3,10),
+        description[:sentence_len * _randint(3,10)],
         up, ws, cp,
-        round(random.uniform(0.01,100), 3), l, w, h, round(l*w*h, 4),
-        random.randint(0,10000), random.randint(5,100), random.randint(50,5000),
-        round(random.uniform(0,100), 8),
-        float(round(random.uniform(1,5), 2)),
-        random.randint(0,5000), random.randint(0,1_000_000),
-        1 if random.random()>0.25 else 0, 1 if random.random()<0.1 else 0,
-        1 if random.random()<0.2 else 0, 1 if cat=='Chemicals' else 0,
-        1 if random.random()<0.3 else 0, 1 if random.random()<0.05 else 0,
-        launch, disc, date.today() - timedelta(days=random.randint(0,90)),
-        datetime.now() - timedelta(days=random.randint(0,60)), datetime.now(),
-        json.dumps(random.sample(['industrial','premium','sale','new','eco','certified'], k=random.randint(1,4))),
-        json.dumps(random.sample(COLORS, k=random.randint(1,4))),
-        json.dumps([f"SKU-{random.choice(list(CATEGORIES.keys()))[:3].upper()}-{random.randint(1,9999):06d}"
-                    for _ in range(random.randint(0,3))]),
-        json.dumps([random.randint(1,20) for _ in range(random.randint(1,4))]),
-        json.dumps({'material': random.choice(['Steel','Aluminum','Plastic']),
-                    'ip_rating': f"IP{random.choice([54,65,67,68])}"}),
-        json.dumps({'ship_class': random.choice(['Standard','Oversize','Hazmat']),
-                    'est_days': random.randint(1,14)}),
-        json.dumps({'supplier_id': f"SUP-{random.randint(100,999)}",
-                    'lead_time_days': random.randint(7,90)}),
-        json.dumps({'title': f"Buy {subcat} from {brand}"}),
-        bytes(random.getrandbits(8) for _ in range(64)),
-        f"Margin tier {random.choice(['A','B','C'])}" if random.random() > 0.6 else None,
-        random.choice(COUNTRIES),
-        f"{random.randint(1000,9999)}.{random.randint(10,99)}.{random.randint(10,99)}"
+        round(_uniform(0.01,100), 3), l, w, h, round(l*w*h, 4),
+        _randint(0,10000), _randint(5,100), _randint(50,5000),
+        round(_uniform(0,100), 8),
+        float(round(_uniform(1,5), 2)),
+        _randint(0,5000), _randint(0,1_000_000),
+        1 if _random()>0.25 else 0, 1 if _random()<0.1 else 0,
+        1 if _random()<0.2 else 0, 1 if cat=='Chemicals' else 0,
+        1 if _random()<0.3 else 0, 1 if _random()<0.05 else 0,
+        launch, disc, now.date() - timedelta(days=_randint(0,90)),
+        now - timedelta(days=_randint(0,60)), now,
+        dump_json(_sample(PRODUCT_TAGS, k=_randint(1,4))),
+        dump_json(_sample(COLORS, k=_randint(1,4))),
+        dump_json([f"SKU-{_choice(CATEGORY_NAMES)[:3].upper()}-{_randint(1,9999):06d}"
+                    for _ in range(_randint(0,3))]),
+        dump_json([_randint(1,20) for _ in range(_randint(1,4))]),
+        dump_json({'material': _choice(MATERIALS),
+                    'ip_rating': _choice(IP_RATINGS)}),
+        dump_json({'ship_class': _choice(SHIP_CLASSES),
+                    'est_days': _randint(1,14)}),
+        dump_json({'supplier_id': f"SUP-{_randint(100,999)}",
+                    'lead_time_days': _randint(7,90)}),
+        dump_json({'title': f"Buy {subcat} from {brand}"}),
+        os.urandom(64),
+        _choice(MARGIN_TIERS) if _random() > 0.6 else None,
+        _choice(COUNTRIES),
+        f"{_randint(1000,9999)}.{_randint(10,99)}.{_randint(10,99)}"
     )
 
 
@@ -588,10 +659,10 @@ def gen_product(idx):
 # Runner — MSSQL requires creating the 'citadel' database first
 # =====================================================================================
 TABLE_CONFIG = [
-    ('invoices',        INVOICES_DDL,  INVOICES_INSERT,  gen_invoice),
-    ('employees',       EMPLOYEES_DDL, EMPLOYEES_INSERT, gen_employee),
-    ('sensor_readings', SENSOR_DDL,    SENSOR_INSERT,    gen_sensor_reading),
-    ('product_catalog', CATALOG_DDL,   CATALOG_INSERT,   gen_product),
+    ('invoices',        INVOICES_DDL,  INVOICES_IDX,  INVOICES_INSERT,  gen_invoice),
+    ('employees',       EMPLOYEES_DDL, EMPLOYEES_IDX, EMPLOYEES_INSERT, gen_employee),
+    ('sensor_readings', SENSOR_DDL,    [],            SENSOR_INSERT,    gen_sensor_reading),
+    ('product_catalog', CATALOG_DDL,   CATALOG_IDX,   CATALOG_INSERT,   gen_product),
 ]
 
 def ensure_database(server, user, password, database, port):
@@ -611,35 +682,253 @@ def ensure_database(server, user, password, database, port):
     finally:
         conn.close()
 
-def run(server, user, password, database, port=1433, total_records=1000, batch_size=100):
-    # Ensure database exists
-    ensure_database(server, user, password, database, port)
-
+def set_recovery_model(server, user, password, database, port, model, only_from=None):
+    """
+    Switch the recovery model of `database` and return the previous one, or None
+    when nothing was changed. With `only_from`, the switch only happens while the
+    database is in that model.
+    Under BULK_LOGGED (or SIMPLE), TABLOCK bulk loads into a heap are minimally
+    logged, so the load writes far less transaction log than under FULL.
+    """
+    # ALTER DATABASE cannot run inside a transaction
     conn = pymssql.connect(server=server, user=user, password=password,
-                           database=database, port=port, as_dict=True) # type: ignore
+                           database='master', port=port, autocommit=True)
     try:
-        for table_name, ddl, insert_sql, gen_fn in TABLE_CONFIG:
-            print(f"\n{'='*60}")
-            print(f"  Processing table: {table_name}")
-            print(f"{'='*60}")
-
-            # Ensure a clean table exists
-            ensure_table(conn, table_name, ddl)
-
-            inserted = 0
-            for batch_start in range(0, total_records, batch_size):
-                batch_end = min(batch_start + batch_size, total_records)
-                batch = [gen_fn(i) for i in range(batch_start, batch_end)]
-                with conn.cursor() as cur:
-                    cur.executemany(insert_sql, batch)
-                conn.commit()
-                inserted += len(batch)
-                print(f"  [{table_name}] Inserted {inserted}/{total_records}")
+        with conn.cursor() as cur:
+            cur.execute("SELECT recovery_model_desc FROM sys.databases WHERE name = %s",
+                        (database,))
+            previous = cur.fetchone()[0]
+            if previous == model or (only_from and previous != only_from):
+                return None
+            cur.execute(f"ALTER DATABASE [{database}] SET RECOVERY {model}")
+        return previous
+    finally:
+        conn.close()
 
-            print(f"  Completed {table_name}: {inserted} records total.")
+def add_constraints(conn, table_name, statements):
+    """Apply the post-load UNIQUE/CHECK constraints, validating all rows in one pass each"""
+    if not statements:
+        return
+    print(f"  Adding {len(statements)} constraints on {table_name}...")
+    with conn.cursor() as cur:
+        for stmt in statements:
+            cur.execute(stmt)
+    conn.commit()
+
+def insert_columns(insert_sql):
+    """Extract the target column names from a parameterized INSERT statement"""
+    # The column list is the last parenthesized group before VALUES (after any table hint)
+    head = insert_sql[:insert_sql.index('VALUES')]
+    column_list = head[head.rindex('(') + 1:head.rindex(')')]
+    return [col.strip() for col in column_list.split(',')]
+
+def table_column_ids(conn, table_name, columns):
+    """
+    Map column names to the 1-based column ordinals expected by bulk_copy.
+    IDENTITY columns are left out of the INSERT column lists, so the generated
+    tuples do not line up with the physical column order of the table.
+    """
+    with conn.cursor() as cur:
+        cur.execute("SELECT name, column_id FROM sys.columns WHERE object_id = OBJECT_ID(%s)",
+                    (table_name,))
+        ordinals = {row['name']: row['column_id'] for row in cur.fetchall()}
+    return [ordinals[col] for col in columns]
+
+# SQL Server rejects table value constructors with more than 1000 row expressions
+MAX_VALUES_ROWS = 1000
+
+# pymssql has no server-side prepare (parameters are interpolated client-side),
+# so the statement text is the only part worth reusing: every full chunk of a
+# table shares the same template, built once here instead of once per chunk.
+@functools.lru_cache(maxsize=None)
+def build_multirow_insert(insert_sql, row_count):
+    """Rewrite a single-row INSERT template into one INSERT with `row_count` VALUES groups"""
+    head = insert_sql[:insert_sql.index('VALUES')]
+    group = '(' + ','.join(['%s'] * len(insert_columns(insert_sql))) + ')'
+    return f"{head}VALUES {','.join([group] * row_count)}"
+
+# pymssql's bulk_copy binds `date` as DATETIME and rejects it, has no mapping for
+# `time`, and cuts `datetime` down to milliseconds. Temporal values are therefore
+# sent as ISO 8601 text, which SQL Server converts to the column's own type.
+BULK_COPY_AS_TEXT = {date: date.isoformat, time: time.isoformat,
+                     datetime: datetime.isoformat}
+
+def bulk_copy_row(row, _as_text=BULK_COPY_AS_TEXT.get):
+    """Return `row` with its date/time/datetime values rendered as ISO 8601 strings"""
+    return tuple([conv(v) if (conv := _as_text(type(v))) else v for v in row])
+
+def insert_batch(conn, table_name, insert_sql, column_ids, rows, row_count,
+                 use_bulk_copy=False):
+    """
+    Send one batch of generated rows to SQL Server. `rows` may be any iterable,
+    including a lazy generator, so a batch never has to exist as a list.
+
+    With `use_bulk_copy` the rows go through the TDS bulk-load API. Otherwise
+    they are folded into multi-row INSERT statements (chunks of MAX_VALUES_ROWS)
+    so a batch costs a handful of round-trips instead of one per row.
+    """
+    if use_bulk_copy:
+        conn.bulk_copy(table_name, map(bulk_copy_row, rows), column_ids=column_ids,
+                       batch_size=row_count, tablock=True)
+        return
+
+    rows = iter(rows)
+    with conn.cursor() as cur:
+        while chunk := list(islice(rows, MAX_VALUES_ROWS)):
+            params = tuple(value for row in chunk for value in row)
+            cur.execute(build_multirow_insert(insert_sql, len(chunk)), params)
+
+def start_gen_pool(gen_workers):
+    """
+    Start the batch-generation processes before any loader thread exists.
+    They are spawned, not forked: the pool starts workers lazily, and forking
+    from a producer thread while other threads sit in pymssql calls can deadlock
+    the child. Spawned workers also get their own random state.
+    """
+    gen_pool = ProcessPoolExecutor(max_workers=gen_workers,
+                                   mp_context=multiprocessing.get_context('spawn'))
+    # One task per worker brings the whole pool up now, from the main thread
+    for future in [gen_pool.submit(os.getpid) for _ in range(gen_workers)]:
+        future.result()
+    return gen_pool
+
+def iter_rows(gen_fn, batch_start, batch_end):
+    """Lazily generate the rows [batch_start, batch_end) of a table"""
+    # One clock read per batch; rows in a batch share the same "now"
+    now = datetime.now()
+    return (gen_fn(i, now) for i in range(batch_start, batch_end))
+
+def generate_batch(gen_fn, batch_start, batch_end):
+    """Build the rows [batch_start, batch_end) of a table as a list"""
+    return list(iter_rows(gen_fn, batch_start, batch_end))
+
+def produce_batches(gen_fn, total_records, batch_size, batches, gen_pool=None):
+    """
+    Generate row batches on a background thread and hand them over through
+    `batches`, so building the next batch overlaps with sending the current one.
+    With `gen_pool` the batches are built in worker processes instead, keeping
+    up to `batches.maxsize` of them in flight. A trailing None marks the end;
+    an exception is forwarded to the consumer.
+    """
+    try:
+        pending = deque()
+        for batch_start in range(0, total_records, batch_size):
+            batch_end = min(batch_start + batch_size, total_records)
+            if gen_pool is None:
+                batches.put(generate_batch(gen_fn, batch_start, batch_end))
+                continue
+            pending.append(gen_pool.submit(generate_batch, gen_fn, batch_start, batch_end))
+            if len(pending) >= max(batches.maxsize, 1):
+                batches.put(pending.popleft().result())
+        while pending:
+            batches.put(pending.popleft().result())
+    except Exception as e:
+        batches.put(e)
+        return
+    batches.put(None)
+
+def drain_batches(batches):
+    """Yield (rows, row_count) for each batch queued by produce_batches"""
+    while (batch := batches.get()) is not None:
+        if isinstance(batch, Exception):
+            raise batch
+        yield batch, len(batch)
+
+def stream_batches(gen_fn, total_records, batch_size):
+    """Yield (rows, row_count) with rows as lazy generators, for loads without read-ahead"""
+    for batch_start in range(0, total_records, batch_size):
+        batch_end = min(batch_start + batch_size, total_records)
+        yield iter_rows(gen_fn, batch_start, batch_end), batch_end - batch_start
+
+def load_table(conn_kwargs, table_config, total_records, batch_size, bulk_copy=False,
+               prefetch_batches=2, gen_pool=None):
+    """Create one table and stream its generated rows over a dedicated connection"""
+    table_name, ddl, constraints, insert_sql, gen_fn = table_config
+    conn = pymssql.connect(**conn_kwargs)
+    try:
+        print(f"  Processing table: {table_name}")
+
+        # Skip the DONE_IN_PROC row-count messages sent back for every statement
+        with conn.cursor() as cur:
+            cur.execute("SET NOCOUNT ON")
+
+        # bulk_copy() landed in pymssql 2.2.8; older builds fall back to multi-row INSERTs
+        use_bulk_copy = bulk_copy and hasattr(conn, 'bulk_copy')
+
+        # Ensure a clean table exists
+        ensure_table(conn, table_name, ddl)
+        column_ids = table_column_ids(conn, table_name, insert_columns(insert_sql))
+
+        producer = None
+        if prefetch_batches > 0:
+            # Bounded queue: at most `prefetch_batches` batches are generated ahead of the inserts
+            batches = queue.Queue(maxsize=prefetch_batches)
+            producer = threading.Thread(target=produce_batches, daemon=True,
+                                        args=(gen_fn, total_records, batch_size, batches,
+                                              gen_pool))
+            producer.start()
+            pending = drain_batches(batches)
+        else:
+            # No read-ahead: rows flow from the generator straight into the driver,
+            # so no batch is ever materialized (lowest memory, no overlap)
+            pending = stream_batches(gen_fn, total_records, batch_size)
+
+        # All batches of a table go into one transaction: a single log flush at the
+        # end instead of one per batch, and a failed load leaves an empty table
+        inserted = 0
+        try:
+            for rows, row_count in pending:
+                insert_batch(conn, table_name, insert_sql, column_ids, rows, row_count,
+                             use_bulk_copy)
+                inserted += row_count
+                print(f"  [{table_name}] Inserted {inserted}/{total_records}")
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        if producer is not None:
+            producer.join()
+
+        add_constraints(conn, table_name, constraints)
+        print(f"  Completed {table_name}: {inserted} records total.")
     finally:
         conn.close()
 
+def run(server, user, password, database, port=1433, total_records=1000, batch_size=100,
+        bulk_copy=False, prefetch_batches=2, gen_workers=0):
+    # Ensure database exists
+    ensure_database(server, user, password, database, port)
+
+    conn_kwargs = dict(server=server, user=user, password=password,
+                       database=database, port=port, as_dict=True)
+
+    # Load under BULK_LOGGED for minimal logging; only FULL needs the switch (SIMPLE is
+    # already minimally logged), and the original model is put back afterwards
+    recovery_model = set_recovery_model(server, user, password, database, port, 'BULK_LOGGED',
+                                        only_from='FULL')
+
+    # The tables are independent, so each one is loaded concurrently on its own connection
+    print(f"\n{'='*60}")
+    print(f"  Loading {len(TABLE_CONFIG)} tables in parallel")
+    print(f"{'='*60}")
+
+    # Row generation is pure-Python CPU work, so the loader threads only scale it
+    # past the GIL when batches are built in a shared pool of worker processes
+    gen_pool = start_gen_pool(gen_workers) if gen_workers else None
+    try:
+        with ThreadPoolExecutor(max_workers=len(TABLE_CONFIG)) as pool:
+            futures = [pool.submit(load_table, conn_kwargs, table_config,
+                                   total_records, batch_size, bulk_copy, prefetch_batches,
+                                   gen_pool)
+                       for table_config in TABLE_CONFIG]
+            for future in futures:
+                future.result()
+    finally:
+        if gen_pool is not None:
+            gen_pool.shutdown(cancel_futures=True)
+        if recovery_model is not None:
+            set_recovery_model(server, user, password, database, port, recovery_model)
+
     print(f"\nAll tables populated successfully.")
 
 
@@ -651,7 +940,7 @@ def main():
         database="citadel",
         port=1433,
         total_records=5000,
-        batch_size=500
+        batch_size=5000
     )
 
 if __name__ == "__main__":
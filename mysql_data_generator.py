@@ -13,15 +13,21 @@
 #   - ENUM type is native
 # =====================================================================================
 
-import pymysql
+try:
+    # mysqlclient (libmysqlclient C driver) when installed; escaping and packet
+    # handling run in C instead of pure Python
+    import MySQLdb as mysql_driver
+except ImportError:
+    import pymysql as mysql_driver
 import random
-import string
-from decimal import Decimal
 from datetime import datetime, date, timedelta, time, timezone
-import uuid
 import json
-import ipaddress
+import os
 import sys
+import tempfile
+import queue
+import threading
+from concurrent.futures import ProcessPoolExecutor
 
 # -------------------------------------------------------------------------------------
 # Shared helpers
@@ -33,17 +39,43 @@ PLANTS = ['US-PLANT-01','GER-PLANT-02','JP-PLANT-03','CN-PLANT-04','IN-PLANT-05'
 TIMEZONES = ['UTC','US/Eastern','Europe/Berlin','Asia/Tokyo','Asia/Shanghai',
              'Asia/Kolkata','Australia/Sydney']
 
+def coin():
+    # Single C-level draw for a 50/50 BOOLEAN column
+    return bool(random.getrandbits(1))
+
 def rand_str(n=8):
-    return ''.join(random.choices(string.ascii_letters + string.digits, k=n))
+    # Hex from one urandom call instead of n random.choices picks
+    return os.urandom((n + 1) // 2).hex()[:n]
 
-def rand_ipv4():
-    return str(ipaddress.IPv4Address(random.randint(0x0A000001, 0x0AFFFFFF)))
+def rand_ipv4(_randrange=random.randrange):
+    # 10.0.0.1-10.255.255.255 formatted directly, without an IPv4Address object
+    host = _randrange(1, 1 << 24)
+    return f"10.{host >> 16}.{host >> 8 & 255}.{host & 255}"
 
 def rand_mac():
-    return ':'.join(f'{random.randint(0,255):02x}' for _ in range(6))
+    return os.urandom(6).hex(':')
+
+# Variant nibble 8-b for each random hex digit at that position
+UUID_VARIANT = dict(zip('0123456789abcdef', '89ab' * 4))
+
+def rand_uuid():
+    # Version-4 UUID text straight from urandom hex, without building a uuid.UUID
+    h = os.urandom(16).hex()
+    return f"{h[:8]}-{h[8:12]}-4{h[13:16]}-{UUID_VARIANT[h[16]]}{h[17:20]}-{h[20:]}"
+
+# Compact encoder built once: skips json.dumps' per-call option handling and
+# drops the padding spaces from every JSON column
+dump_json = json.JSONEncoder(separators=(',', ':')).encode
+
+# Random bytes drawn once; BLOB columns take windows of it at random offsets
+BLOB_POOL = os.urandom(1 << 20)
 
-def rand_semver():
-    return f"{random.randint(0,9)}.{random.randint(0,99)}.{random.randint(0,999)}"
+def rand_blob(n):
+    offset = random.randrange(len(BLOB_POOL) - n + 1)
+    return BLOB_POOL[offset:offset + n]
+
+def rand_semver(_randint=random.randint):
+    return f"{_randint(0,9)}.{_randint(0,99)}.{_randint(0,999)}"
 
 # =====================================================================================
 # Database Helper: Ensure a clean table exists for data generation
@@ -72,7 +104,7 @@ def ensure_table(conn, table_name: str, ddl: str):
 INVOICES_DDL = """
 CREATE TABLE IF NOT EXISTS invoices (
     invoice_id          INT AUTO_INCREMENT PRIMARY KEY,
-    invoice_number      VARCHAR(50) UNIQUE NOT NULL,
+    invoice_number      VARCHAR(50) NOT NULL,
     customer_id         INT NOT NULL,
     customer_code       VARCHAR(20) NOT NULL,
     customer_name       VARCHAR(255) NOT NULL,
@@ -122,18 +154,22 @@ CREATE TABLE IF NOT EXISTS invoices (
     quality_check_passed BOOLEAN,
     compliance_verified  BOOLEAN,
 
-    INDEX idx_inv_number (invoice_number),
-    INDEX idx_inv_cust   (customer_code),
-    INDEX idx_inv_date   (invoice_date),
-    INDEX idx_inv_paid   (is_paid),
-    INDEX idx_inv_status (status),
-
     CHECK (total_amount >= 0),
     CHECK (tax_amount >= 0),
     CHECK (discount_amount >= 0)
 ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
 """
 
+# Secondary and unique indexes are created after the load: one sorted build per index
+# instead of B-tree maintenance on every inserted row
+INVOICES_IDX = [
+    "CREATE UNIQUE INDEX uq_inv_number ON invoices(invoice_number)",
+    "CREATE INDEX idx_inv_cust   ON invoices(customer_code)",
+    "CREATE INDEX idx_inv_date   ON invoices(invoice_date)",
+    "CREATE INDEX idx_inv_paid   ON invoices(is_paid)",
+    "CREATE INDEX idx_inv_status ON invoices(status)",
+]
+
 INVOICES_INSERT = """
 INSERT INTO invoices (
     invoice_number, customer_id, customer_code, customer_name, customer_address,
@@ -150,58 +186,68 @@ INSERT INTO invoices (
 )
 """
 
-def gen_invoice(idx):
-    billing = random.choice(COUNTRIES)
-    shipping = random.choice(COUNTRIES)
-    items_count = random.randint(1, 15)
-    items, subtotal = [], Decimal('0.00')
-    for j in range(items_count):
-        up = Decimal(str(round(random.uniform(10, 1000), 2)))
-        qty = random.randint(1, 50)
-        total = up * qty
-        items.append({
-            'item_id': j+1, 'product_code': f"PROD-{random.randint(1000,9999)}",
-            'description': f'Part {random.randint(100,999)}', 'quantity': qty,
-            'unit_price': float(up), 'total_amount': float(total),
-            'uom': random.choice(['PCS','KG','M','L']),
-            'hs_code': f"{random.randint(1000,9999)}.{random.randint(10,99)}"
-        })
-        subtotal += total
-
-    discount = Decimal(str(round(random.uniform(0, min(float(subtotal*Decimal('0.2')), 500)), 2)))
-    ship_cost = Decimal(str(round(random.uniform(0, 200), 2)))
-    tax_rate = round(random.uniform(0.05, 0.25), 3)
-    tax_amt = (subtotal - discount) * Decimal(str(tax_rate))
+# Only batch_id varies, so the metadata document is a filled-in template
+INVOICE_METADATA = '{"version":"1.0","batch_id":"%s"}'
+UOMS = ['PCS','KG','M','L']
+PAYMENT_TERMS = ['NET30','NET60','DUE_ON_RECEIPT','NET15']
+INVOICE_STATUSES = ['DRAFT','SENT','PAID','OVERDUE','CANCELLED']
+# Small-domain codes are formatted once here; rows pick a ready-made string
+SALES_REPS = [f"SalesRep-{i}" for i in range(1, 51)]
+CUSTOMER_NAMES = [f"Customer {i} Corp." for i in range(1, 1001)]
+PRODUCT_CODES = [f"PROD-{i}" for i in range(1000, 10000)]
+PROJECT_CODES = [f"PROJ-{i}" for i in range(1000, 10000)]
+COST_CENTERS = [f"CC-{i}" for i in range(100, 1000)]
+
+def gen_invoice(idx, now, _choice=random.choice, _randint=random.randint,
+                _uniform=random.uniform):
+    billing = _choice(COUNTRIES)
+    shipping = _choice(COUNTRIES)
+    items_count = _randint(1, 15)
+    # Money is kept in integer cents: exact like Decimal, but plain int arithmetic
+    lines = [(_randint(1000, 100000), _randint(1, 50)) for _ in range(items_count)]
+    subtotal = sum(up * qty for up, qty in lines)
+    items = [{
+        'item_id': j, 'product_code': _choice(PRODUCT_CODES),
+        'description': f'Part {_randint(100,999)}', 'quantity': qty,
+        'unit_price': up / 100, 'total_amount': up * qty / 100,
+        'uom': _choice(UOMS),
+        'hs_code': f"{_randint(1000,9999)}.{_randint(10,99)}"
+    } for j, (up, qty) in enumerate(lines, 1)]
+
+    discount = _randint(0, min(subtotal // 5, 50000))
+    ship_cost = _randint(0, 20000)
+    tax_rate = round(_uniform(0.05, 0.25), 3)
+    tax_amt = round((subtotal - discount) * tax_rate)
     total_amt = subtotal - discount + tax_amt + ship_cost
 
-    base_dt = date.today() - timedelta(days=random.randint(0, 365))
-    created = datetime.now() - timedelta(days=random.randint(0, 30))
-    pay_dt = created - timedelta(days=random.randint(1,15)) if random.random() > 0.5 else None
-    ship_dt = created - timedelta(days=random.randint(1,10)) if random.random() > 0.5 else None
-    appr_dt = created - timedelta(days=random.randint(1,5)) if random.random() > 0.5 else None
+    base_dt = now.date() - timedelta(days=_randint(0, 365))
+    created = now - timedelta(days=_randint(0, 30))
+    pay_dt = created - timedelta(days=_randint(1,15)) if coin() else None
+    ship_dt = created - timedelta(days=_randint(1,10)) if coin() else None
+    appr_dt = created - timedelta(days=_randint(1,5)) if coin() else None
 
     return (
-        f"INV-{date.today().strftime('%Y%m')}-{idx+1:06d}",
-        random.randint(1000,9999), f"CUST-{random.randint(10000,99999)}",
-        f"Customer {random.randint(1,1000)} Corp.",
-        f"{random.randint(1,9999)} Main St, City {random.randint(1,100)}, {billing}",
-        billing, shipping, random.choice(CURRENCIES),
-        random.choice(['NET30','NET60','DUE_ON_RECEIPT','NET15']),
-        f"SalesRep-{random.randint(1,50)}",
-        float(total_amt), float(tax_amt), float(discount), float(ship_cost), float(subtotal),
-        items_count, random.randint(0,5), random.randint(1,10),
-        round(random.uniform(0.8,1.2), 4), tax_rate,
-        random.choice([True,False]), random.choice([True,False]),
-        random.choice([True,False]), random.choice([True,False]),
+        f"INV-{now:%Y%m}-{idx+1:06d}",
+        _randint(1000,9999), f"CUST-{_randint(10000,99999)}",
+        _choice(CUSTOMER_NAMES),
+        f"{_randint(1,9999)} Main St, City {_randint(1,100)}, {billing}",
+        billing, shipping, _choice(CURRENCIES),
+        _choice(PAYMENT_TERMS),
+        _choice(SALES_REPS),
+        total_amt / 100, tax_amt / 100, discount / 100, ship_cost / 100, subtotal / 100,
+        items_count, _randint(0,5), _randint(1,10),
+        round(_uniform(0.8,1.2), 4), tax_rate,
+        coin(), coin(),
+        coin(), coin(),
         billing != shipping,
-        base_dt, base_dt + timedelta(days=random.randint(15,90)),
+        base_dt, base_dt + timedelta(days=_randint(15,90)),
         created, pay_dt, ship_dt, appr_dt,
-        random.choice(TIMEZONES), json.dumps(items),
-        bytes(random.getrandbits(8) for _ in range(64)),
-        json.dumps({'version':'1.0','batch_id': str(uuid.uuid4())}),
-        random.choice(['DRAFT','SENT','PAID','OVERDUE','CANCELLED']),
-        f"PROJ-{random.randint(1000,9999)}", f"CC-{random.randint(100,999)}",
-        random.choice(PLANTS), random.choice([True,False]), random.choice([True,False])
+        _choice(TIMEZONES), dump_json(items),
+        rand_blob(64),
+        INVOICE_METADATA % rand_uuid(),
+        _choice(INVOICE_STATUSES),
+        _choice(PROJECT_CODES), _choice(COST_CENTERS),
+        _choice(PLANTS), coin(), coin()
     )
 
 
@@ -212,7 +258,7 @@ EMPLOYEES_DDL = """
 CREATE TABLE IF NOT EXISTS employees (
     employee_id         INT AUTO_INCREMENT PRIMARY KEY,
     employee_uuid       CHAR(36) NOT NULL,
-    employee_code       VARCHAR(20) UNIQUE NOT NULL,
+    employee_code       VARCHAR(20) NOT NULL,
     first_name          VARCHAR(100) NOT NULL,
     last_name           VARCHAR(100) NOT NULL,
     full_name           VARCHAR(201) GENERATED ALWAYS AS (CONCAT(first_name, ' ', last_name)) STORED,
@@ -262,15 +308,17 @@ CREATE TABLE IF NOT EXISTS employees (
     bio                 TEXT,
     notes               TEXT,
 
-    INDEX idx_emp_uuid (employee_uuid),
-    INDEX idx_emp_code (employee_code),
-    INDEX idx_emp_dept (department),
-    INDEX idx_emp_active (is_active),
-
     CHECK (base_salary >= 0)
 ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
 """
 
+EMPLOYEES_IDX = [
+    "CREATE INDEX idx_emp_uuid   ON employees(employee_uuid)",
+    "CREATE UNIQUE INDEX uq_emp_code ON employees(employee_code)",
+    "CREATE INDEX idx_emp_dept   ON employees(department)",
+    "CREATE INDEX idx_emp_active ON employees(is_active)",
+]
+
 EMPLOYEES_INSERT = """
 INSERT INTO employees (
     employee_uuid, employee_code, first_name, last_name, email, phone_number,
@@ -299,48 +347,58 @@ JOB_TITLES = ['Software Engineer','Analyst','Manager','Director','VP','Intern','
 SKILLS_POOL = ['Python','Java','SQL','AWS','Docker','Kubernetes','React','TypeScript','Go','Rust',
                'Terraform','CI/CD','Machine Learning','Data Engineering','Kafka','Spark']
 CERTS_POOL = ['AWS-SAA','AWS-SAP','CKA','PMP','CISSP','TOGAF','AZ-900','GCP-ACE','CKAD','OCP']
-
-def gen_employee(idx):
-    fn = random.choice(FIRST_NAMES)
-    ln = random.choice(LAST_NAMES)
-    dob = date(random.randint(1960,2002), random.randint(1,12), random.randint(1,28))
-    hire = date(random.randint(2010,2025), random.randint(1,12), random.randint(1,28))
-    term = hire + timedelta(days=random.randint(180,1800)) if random.random() < 0.15 else None
+GENDERS = ['Male','Female','Non-Binary','Prefer Not to Say']
+EMPLOYMENT_TYPES = ['Full-Time','Part-Time','Contract','Intern']
+REMOTE_ELIGIBILITY = [True,False,None]
+PROBATION_PERIODS = ['3 months','6 months']
+ADDRESS_CITIES = ['Tokyo','Berlin','Mumbai','NYC']
+RELATIONS = ['Spouse','Parent','Sibling']
+THEMES = ['dark','light']
+LANGUAGES = ['en','de','ja','hi']
+
+def gen_employee(idx, now, _choice=random.choice, _randint=random.randint,
+                 _uniform=random.uniform, _random=random.random,
+                 _sample=random.sample):
+    fn = _choice(FIRST_NAMES)
+    ln = _choice(LAST_NAMES)
+    dob = date(_randint(1960,2002), _randint(1,12), _randint(1,28))
+    hire = date(_randint(2010,2025), _randint(1,12), _randint(1,28))
+    term = hire + timedelta(days=_randint(180,1800)) if _random() < 0.15 else None
 
     return (
-        str(uuid.uuid4()), f"EMP-{idx+1:06d}", fn, ln,
-        f"{fn.lower()}.{ln.lower()}{random.randint(1,99)}@example.com",
-        f"+{random.randint(1,99)}-{random.randint(100,999)}-{random.randint(1000,9999)}",
-        random.choice(['Male','Female','Non-Binary','Prefer Not to Say']),
-        random.choice(['Full-Time','Part-Time','Contract','Intern']),
-        random.choice(DEPARTMENTS), random.choice(JOB_TITLES), random.randint(1,10),
-        float(round(random.uniform(30000,250000), 2)),
-        round(random.uniform(0,0.30), 4),
-        random.randint(0,50000), random.randint(0,35),
-        round(random.uniform(1.0,5.0), 6), random.randint(100000,999999),
-        random.choice([True,False]), random.choice([True,False]),
-        random.choice([True,False]), random.choice([True,False,None]),
+        rand_uuid(), f"EMP-{idx+1:06d}", fn, ln,
+        f"{fn.lower()}.{ln.lower()}{_randint(1,99)}@example.com",
+        f"+{_randint(1,99)}-{_randint(100,999)}-{_randint(1000,9999)}",
+        _choice(GENDERS),
+        _choice(EMPLOYMENT_TYPES),
+        _choice(DEPARTMENTS), _choice(JOB_TITLES), _randint(1,10),
+        round(_uniform(30000,250000), 2),
+        round(_uniform(0,0.30), 4),
+        _randint(0,50000), _randint(0,35),
+        round(_uniform(1.0,5.0), 6), _randint(100000,999999),
+        coin(), coin(),
+        coin(), _choice(REMOTE_ELIGIBILITY),
         dob, hire, term,
-        time(random.randint(0,23), random.randint(0,59), random.randint(0,59)),
-        time(random.randint(6,10), 0, 0),
-        datetime.now() - timedelta(days=random.randint(0,30)),
-        datetime.now() - timedelta(days=random.randint(0,10)),
-        f"{random.choice([3,6])} months",
+        time(_randint(0,23), _randint(0,59), _randint(0,59)),
+        time(_randint(6,10), 0, 0),
+        now - timedelta(days=_randint(0,30)),
+        now - timedelta(days=_randint(0,10)),
+        _choice(PROBATION_PERIODS),
         rand_ipv4(), rand_mac(),
-        json.dumps(random.sample(SKILLS_POOL, k=random.randint(2,7))),
-        json.dumps(random.sample(CERTS_POOL, k=random.randint(0,4))),
-        json.dumps([random.randint(1000,9999) for _ in range(random.randint(1,5))]),
-        json.dumps({'street': f"{random.randint(1,9999)} Oak St",
-                    'city': random.choice(['Tokyo','Berlin','Mumbai','NYC']),
-                    'country': random.choice(COUNTRIES)}),
-        json.dumps({'name': f"{random.choice(FIRST_NAMES)} {random.choice(LAST_NAMES)}",
-                    'phone': f"+1-555-{random.randint(1000,9999)}",
-                    'relation': random.choice(['Spouse','Parent','Sibling'])}),
-        json.dumps({'theme': random.choice(['dark','light']),
-                    'language': random.choice(['en','de','ja','hi'])}),
-        bytes(random.getrandbits(8) for _ in range(128)),
-        f"Experienced {random.choice(JOB_TITLES).lower()} with {random.randint(1,20)} years.",
-        f"Note: {rand_str(50)}" if random.random() > 0.5 else None
+        dump_json(_sample(SKILLS_POOL, k=_randint(2,7))),
+        dump_json(_sample(CERTS_POOL, k=_randint(0,4))),
+        dump_json([_randint(1000,9999) for _ in range(_randint(1,5))]),
+        dump_json({'street': f"{_randint(1,9999)} Oak St",
+                    'city': _choice(ADDRESS_CITIES),
+                    'country': _choice(COUNTRIES)}),
+        dump_json({'name': f"{_choice(FIRST_NAMES)} {_choice(LAST_NAMES)}",
+                    'phone': f"+1-555-{_randint(1000,9999)}",
+                    'relation': _choice(RELATIONS)}),
+        dump_json({'theme': _choice(THEMES),
+                    'language': _choice(LANGUAGES)}),
+        rand_blob(128),
+        f"Experienced {_choice(JOB_TITLES).lower()} with {_randint(1,20)} years.",
+        f"Note: {rand_str(50)}" if _random() > 0.5 else None
     )
 
 
@@ -387,15 +445,17 @@ CREATE TABLE IF NOT EXISTS sensor_readings (
 
     raw_payload         BLOB,
     location_name       VARCHAR(200),
-    notes               TEXT,
-
-    INDEX idx_sr_device (device_id),
-    INDEX idx_sr_ts     (reading_timestamp),
-    INDEX idx_sr_date   (reading_date),
-    INDEX idx_sr_anom   (is_anomaly)
+    notes               TEXT
 ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
 """
 
+SENSOR_IDX = [
+    "CREATE INDEX idx_sr_device ON sensor_readings(device_id)",
+    "CREATE INDEX idx_sr_ts     ON sensor_readings(reading_timestamp)",
+    "CREATE INDEX idx_sr_date   ON sensor_readings(reading_date)",
+    "CREATE INDEX idx_sr_anom   ON sensor_readings(is_anomaly)",
+]
+
 SENSOR_INSERT = """
 INSERT INTO sensor_readings (
     reading_uuid, device_id, device_serial, firmware_version,
@@ -414,36 +474,48 @@ INSERT INTO sensor_readings (
 
 SENSOR_LOCATIONS = ['Factory Floor A','Warehouse B','Server Room C','Outdoor Station D',
                     'Cold Storage E','Lab Room F','Rooftop G','Basement H']
-
-def gen_sensor_reading(idx):
-    ts = datetime.now() - timedelta(days=random.randint(0,90), hours=random.randint(0,23),
-                                     minutes=random.randint(0,59), seconds=random.randint(0,59))
+SENSOR_LABELS = ['temp','humidity','pressure','vibration']
+SENSOR_MANUFACTURERS = ['Bosch','Siemens','Honeywell']
+SENSOR_ERROR_CODES = [0,0,0,1,2,99]                         # mostly 0
+TAG_IDS = range(1, 501)
+# Fixed-shape JSON documents filled in as string templates (values never need escaping)
+DEVICE_METADATA = '{"manufacturer":"%s","model":"M%d"}'
+ALERT_CONFIG = '{"temp_high":%s,"notify":"%s"}'
+READING_WINDOW_SECONDS = 91 * 86400                         # readings span the last ~90 days
+NOTIFY_CHANNELS = ['email','sms']
+DEVICE_IDS = [f"DEV-{i:04d}" for i in range(1, 201)]
+
+def gen_sensor_reading(idx, now, _choice=random.choice, _randint=random.randint,
+                       _uniform=random.uniform, _random=random.random,
+                       _sample=random.sample, _choices=random.choices,
+                       _randrange=random.randrange):
+    # One draw over the whole window is equivalent to separate day/hour/minute/second draws
+    ts = now - timedelta(seconds=_randrange(READING_WINDOW_SECONDS))
     return (
-        str(uuid.uuid4()), f"DEV-{random.randint(1,200):04d}",
+        rand_uuid(), _choice(DEVICE_IDS),
         rand_str(16).upper(), rand_semver(),
-        float(round(random.uniform(-40,85), 4)),
-        float(round(random.uniform(0,100), 3)),
-        float(round(random.uniform(900,1100), 4)),
-        round(random.uniform(0,48), 3), round(random.uniform(0,10), 8),
-        float(round(random.uniform(0,5000), 6)),
-        float(round(random.uniform(-90,90), 7)),
-        float(round(random.uniform(-180,180), 7)),
-        round(random.uniform(-50,5000), 2),
-        random.randint(-120,0), random.choice([0,0,0,1,2,99]),
-        random.randint(0, 10_000_000),
-        random.random() < 0.05, random.random() > 0.02, random.random() < 0.1,
-        ts, ts + timedelta(milliseconds=random.randint(50,2000)),
+        round(_uniform(-40,85), 4),
+        round(_uniform(0,100), 3),
+        round(_uniform(900,1100), 4),
+        round(_uniform(0,48), 3), round(_uniform(0,10), 8),
+        round(_uniform(0,5000), 6),
+        round(_uniform(-90,90), 7),
+        round(_uniform(-180,180), 7),
+        round(_uniform(-50,5000), 2),
+        _randint(-120,0), _choice(SENSOR_ERROR_CODES),
+        _randint(0, 10_000_000),
+        _random() < 0.05, _random() > 0.02, _random() < 0.1,
+        ts, ts + timedelta(milliseconds=_randint(50,2000)),
         ts.date(), ts.time(),
-        json.dumps([random.randint(1,500) for _ in range(random.randint(1,5))]),
-        json.dumps(random.sample(['temp','humidity','pressure','vibration'], k=random.randint(1,3))),
-        json.dumps([round(random.uniform(-50,150), 6) for _ in range(random.randint(5,20))]),
-        json.dumps({'manufacturer': random.choice(['Bosch','Siemens','Honeywell']),
-                    'model': f"M{random.randint(100,999)}"}),
-        json.dumps({'temp_high': round(random.uniform(50,80), 1),
-                    'notify': random.choice(['email','sms'])}),
-        bytes(random.getrandbits(8) for _ in range(random.randint(32,256))),
-        random.choice(SENSOR_LOCATIONS),
-        f"Reading #{idx+1}" if random.random() > 0.7 else None
+        dump_json(_choices(TAG_IDS, k=_randint(1,5))),
+        dump_json(_sample(SENSOR_LABELS, k=_randint(1,3))),
+        # random() scaled inline: uniform() is a Python-level call per sample
+        dump_json([round(-50 + 200 * _random(), 6) for _ in range(_randint(5,20))]),
+        DEVICE_METADATA % (_choice(SENSOR_MANUFACTURERS), _randint(100,999)),
+        ALERT_CONFIG % (round(_uniform(50,80), 1), _choice(NOTIFY_CHANNELS)),
+        rand_blob(_randint(32,256)),
+        _choice(SENSOR_LOCATIONS),
+        f"Reading #{idx+1}" if _random() > 0.7 else None
     )
 
 
@@ -454,7 +526,7 @@ CATALOG_DDL = """
 CREATE TABLE IF NOT EXISTS product_catalog (
     product_id          INT AUTO_INCREMENT PRIMARY KEY,
     product_uuid        CHAR(36) NOT NULL,
-    sku                 VARCHAR(40) UNIQUE NOT NULL,
+    sku                 VARCHAR(40) NOT NULL,
     product_name        VARCHAR(300) NOT NULL,
     category            VARCHAR(100) NOT NULL,
     subcategory         VARCHAR(100),
@@ -507,16 +579,18 @@ CREATE TABLE IF NOT EXISTS product_catalog (
     country_of_origin   VARCHAR(100),
     hs_tariff_code      VARCHAR(20),
 
-    INDEX idx_cat_sku      (sku),
-    INDEX idx_cat_category (category),
-    INDEX idx_cat_brand    (brand),
-    INDEX idx_cat_active   (is_active),
-
     CHECK (unit_price >= 0),
     CHECK (stock_quantity >= 0)
 ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
 """
 
+CATALOG_IDX = [
+    "CREATE UNIQUE INDEX uq_cat_sku ON product_catalog(sku)",
+    "CREATE INDEX idx_cat_category ON product_catalog(category)",
+    "CREATE INDEX idx_cat_brand    ON product_catalog(brand)",
+    "CREATE INDEX idx_cat_active   ON product_catalog(is_active)",
+]
+
 CATALOG_INSERT = """
 INSERT INTO product_catalog (
     product_uuid, sku, product_name, category, subcategory, brand,
@@ -546,91 +620,298 @@ CATEGORIES = {
 }
 BRANDS = ['Bosch','3M','Siemens','ABB','Schneider','Honeywell','TE Connectivity','Parker']
 COLORS = ['Red','Blue','Green','Black','White','Silver','Yellow','Orange','Gray']
-
-def gen_product(idx):
-    cat = random.choice(list(CATEGORIES.keys()))
-    subcat = random.choice(CATEGORIES[cat])
-    brand = random.choice(BRANDS)
-    up = Decimal(str(round(random.uniform(1,5000), 4)))
-    ws = up * Decimal(str(round(random.uniform(0.5,0.9), 2)))
-    cp = ws * Decimal(str(round(random.uniform(0.4,0.8), 2)))
-    l, w, h = round(random.uniform(1,200),2), round(random.uniform(1,200),2), round(random.uniform(1,200),2)
-
-    launch = date(random.randint(2015,2025), random.randint(1,12), random.randint(1,28))
-    disc = launch + timedelta(days=random.randint(365,3650)) if random.random() < 0.1 else None
+CATEGORY_NAMES = list(CATEGORIES)
+SPECIFICATIONS = '{"material":"%s","ip_rating":"IP%d"}'
+SHIPPING_INFO = '{"ship_class":"%s","est_days":%d}'
+SUPPLIER_INFO = '{"supplier_id":"SUP-%d","lead_time_days":%d}'
+PRODUCT_LINES = ['Pro','Standard','Elite']
+PRODUCT_TAGS = ['industrial','premium','sale','new','eco','certified']
+SEO_KEYWORDS = ['industrial','tools','safety']
+MATERIALS = ['Steel','Aluminum','Plastic']
+IP_RATINGS = [54,65,67,68]
+SHIP_CLASSES = ['Standard','Oversize','Hazmat']
+MARGIN_TIERS = ['Margin tier A','Margin tier B','Margin tier C']
+
+def gen_product(idx, now, _choice=random.choice, _randint=random.randint,
+                _uniform=random.uniform, _random=random.random,
+                _sample=random.sample):
+    cat = _choice(CATEGORY_NAMES)
+    subcat = _choice(CATEGORIES[cat])
+    brand = _choice(BRANDS)
+    up = round(_uniform(1,5000), 4)
+    ws = round(up * round(_uniform(0.5,0.9), 2), 4)
+    cp = round(ws * round(_uniform(0.4,0.8), 2), 4)
+    l, w, h = round(_uniform(1,200),2), round(_uniform(1,200),2), round(_uniform(1,200),2)
+
+    launch = date(_randint(2015,2025), _randint(1,12), _randint(1,28))
+    disc = launch + timedelta(days=_randint(365,3650)) if _random() < 0.1 else None
 
     return (
-        str(uuid.uuid4()), f"SKU-{cat[:3].upper()}-{idx+1:06d}",
-        f"{brand} {subcat} {random.choice(['Pro','Standard','Elite'])} {random.randint(100,999)}",
+        rand_uuid(), f"SKU-{cat[:3].upper()}-{idx+1:06d}",
+        f"{brand} {subcat} {_choice(PRODUCT_LINES)} {_randint(100,999)}",
         cat, subcat, brand,
         f"High-quality {subcat.lower()} for industrial use.",
-        f"Detailed description for {subcat} product by {brand}. " * random.randint(3,10),
-        float(up), float(ws), float(cp),
-        round(random.uniform(0.01,100), 3), l, w, h, round(l*w*h, 4),
-        random.randint(0,10000), random.randint(5,100), random.randint(50,5000),
-        round(random.uniform(0,100), 8),
-        float(round(random.uniform(1,5), 2)),
-        random.randint(0,5000), random.randint(0,1_000_000),
-        random.choice([True,True,True,False]), random.random()<0.1,
-        random.random()<0.2, cat=='Chemicals', random.random()<0.3, random.random()<0.05,
-        launch, disc, date.today() - timedelta(days=random.randint(0,90)),
-        datetime.now() - timedelta(days=random.randint(0,60)), datetime.now(),
-        json.dumps(random.sample(['industrial','premium','sale','new','eco','certified'], k=random.randint(1,4))),
-        json.dumps(random.sample(COLORS, k=random.randint(1,4))),
-        json.dumps([f"SKU-{random.choice(list(CATEGORIES.keys()))[:3].upper()}-{random.randint(1,9999):06d}"
-                    for _ in range(random.randint(0,3))]),
-        json.dumps([random.randint(1,20) for _ in range(random.randint(1,4))]),
-        json.dumps({'material': random.choice(['Steel','Aluminum','Plastic']),
-                    'ip_rating': f"IP{random.choice([54,65,67,68])}"}),
-        json.dumps({'ship_class': random.choice(['Standard','Oversize','Hazmat']),
-                    'est_days': random.randint(1,14)}),
-        json.dumps({'supplier_id': f"SUP-{random.randint(100,999)}",
-                    'lead_time_days': random.randint(7,90)}),
-        json.dumps({'title': f"Buy {subcat} from {brand}",
-                    'keywords': random.sample(['industrial','tools','safety'], k=2)}),
-        bytes(random.getrandbits(8) for _ in range(64)),
-        f"Margin tier {random.choice(['A','B','C'])}" if random.random() > 0.6 else None,
-        random.choice(COUNTRIES),
-        f"{random.randint(1000,9999)}.{random.randint(10,99)}.{random.randint(10,99)}"
+        f"Detailed description for {subcat} product by {brand}. " * _randint(3,10),
+        up, ws, cp,
+        round(_uniform(0.01,100), 3), l, w, h, round(l*w*h, 4),
+        _randint(0,10000), _randint(5,100), _randint(50,5000),
+        round(_uniform(0,100), 8),
+        round(_uniform(1,5), 2),
+        _randint(0,5000), _randint(0,1_000_000),
+        _random() < 0.75, _random()<0.1,
+        _random()<0.2, cat=='Chemicals', _random()<0.3, _random()<0.05,
+        launch, disc, now.date() - timedelta(days=_randint(0,90)),
+        now - timedelta(days=_randint(0,60)), now,
+        dump_json(_sample(PRODUCT_TAGS, k=_randint(1,4))),
+        dump_json(_sample(COLORS, k=_randint(1,4))),
+        dump_json([f"SKU-{_choice(CATEGORY_NAMES)[:3].upper()}-{_randint(1,9999):06d}"
+                    for _ in range(_randint(0,3))]),
+        dump_json([_randint(1,20) for _ in range(_randint(1,4))]),
+        SPECIFICATIONS % (_choice(MATERIALS), _choice(IP_RATINGS)),
+        SHIPPING_INFO % (_choice(SHIP_CLASSES), _randint(1,14)),
+        SUPPLIER_INFO % (_randint(100,999), _randint(7,90)),
+        dump_json({'title': f"Buy {subcat} from {brand}",
+                    'keywords': _sample(SEO_KEYWORDS, k=2)}),
+        rand_blob(64),
+        _choice(MARGIN_TIERS) if _random() > 0.6 else None,
+        _choice(COUNTRIES),
+        f"{_randint(1000,9999)}.{_randint(10,99)}.{_randint(10,99)}"
     )
 
 
+# =====================================================================================
+# Bulk loading via LOAD DATA LOCAL INFILE
+# =====================================================================================
+# Error codes raised when LOCAL INFILE is disabled on the client or the server
+LOCAL_INFILE_DISABLED = (1148, 2068, 3948)
+
+# Escapes for LOAD DATA's default text format (FIELDS ESCAPED BY '\\')
+TSV_ESCAPES = str.maketrans({'\\': '\\\\', '\t': '\\t', '\n': '\\n', '\r': '\\r', '\0': '\\0'})
+
+def insert_columns(insert_sql):
+    """Extract the target column names from a parameterized INSERT statement"""
+    head = insert_sql[:insert_sql.index('VALUES')]
+    column_list = head[head.rindex('(') + 1:head.rindex(')')]
+    return [col.strip() for col in column_list.split(',')]
+
+def blob_columns(ddl):
+    """Names of the BLOB columns declared in a CREATE TABLE statement"""
+    columns = set()
+    for line in ddl.splitlines():
+        parts = line.split()
+        if len(parts) > 1 and parts[1].rstrip(',').endswith('BLOB'):
+            columns.add(parts[0])
+    return columns
+
+def build_load_data(table_name, insert_sql, ddl):
+    """
+    Build the LOAD DATA statement matching a table's INSERT column list.
+    BLOB values are written as hex and decoded server-side with UNHEX, so the
+    file stays valid utf8mb4 text.
+    """
+    blobs = blob_columns(ddl)
+    targets, assignments = [], []
+    for col in insert_columns(insert_sql):
+        if col in blobs:
+            targets.append(f"@{col}")
+            assignments.append(f"{col} = UNHEX(@{col})")
+        else:
+            targets.append(col)
+    sql = (f"LOAD DATA LOCAL INFILE %s INTO TABLE {table_name} CHARACTER SET utf8mb4 "
+           f"FIELDS TERMINATED BY '\\t' LINES TERMINATED BY '\\n' ({', '.join(targets)})")
+    if assignments:
+        sql += f" SET {', '.join(assignments)}"
+    return sql
+
+def tsv_field(value):
+    """Render one value in LOAD DATA's text format"""
+    if value is None:
+        return '\\N'
+    if isinstance(value, str):
+        return value.translate(TSV_ESCAPES)
+    if isinstance(value, bool):
+        return '1' if value else '0'
+    if isinstance(value, bytes):
+        return value.hex()
+    return str(value)
+
+def load_batch(cur, load_sql, batch):
+    """Write one batch to a temporary TSV file and stream it with LOAD DATA LOCAL INFILE"""
+    # The drivers send LOCAL INFILE data by reopening the named file, so it must exist on disk
+    with tempfile.NamedTemporaryFile('w', encoding='utf-8', newline='\n', suffix='.tsv') as f:
+        f.writelines('\t'.join(map(tsv_field, row)) + '\n' for row in batch)
+        f.flush()
+        cur.execute(load_sql, (f.name,))
+
 # =====================================================================================
 # Runner
 # =====================================================================================
 TABLE_CONFIG = [
-    ('invoices',        INVOICES_DDL,  INVOICES_INSERT,  gen_invoice),
-    ('employees',       EMPLOYEES_DDL, EMPLOYEES_INSERT, gen_employee),
-    ('sensor_readings', SENSOR_DDL,    SENSOR_INSERT,    gen_sensor_reading),
-    ('product_catalog', CATALOG_DDL,   CATALOG_INSERT,   gen_product),
+    ('invoices',        INVOICES_DDL,  INVOICES_IDX,  INVOICES_INSERT,  gen_invoice),
+    ('employees',       EMPLOYEES_DDL, EMPLOYEES_IDX, EMPLOYEES_INSERT, gen_employee),
+    ('sensor_readings', SENSOR_DDL,    SENSOR_IDX,    SENSOR_INSERT,    gen_sensor_reading),
+    ('product_catalog', CATALOG_DDL,   CATALOG_IDX,   CATALOG_INSERT,   gen_product),
 ]
 
-def run(host, user, password, database, port=3306, total_records=1000, batch_size=100):
-    conn = pymysql.connect(host=host, user=user, password=password, database=database,
-                           port=port, charset='utf8mb4', cursorclass=pymysql.cursors.DictCursor)
+# Client-side packet ceiling (pymysql's default max_allowed_packet)
+CLIENT_MAX_PACKET = 16 * 1024 * 1024
+
+def insert_statement_limit(cur):
+    """
+    Size limit for the multi-row INSERTs of the fallback path: the smaller of the
+    server's max_allowed_packet and the client's limit, minus a quarter of it (at
+    most 1 MiB) as headroom, and never below 64 KiB.
+    """
+    cur.execute("SELECT @@max_allowed_packet")
+    max_packet = min(cur.fetchone()[0], CLIENT_MAX_PACKET)
+    return max(max_packet - min(max_packet // 4, 1024 * 1024), 64 * 1024)
+
+# Escapes for string literals (MySQL's default mode, backslash escapes enabled)
+SQL_ESCAPES = str.maketrans({'\\': '\\\\', "'": "\\'", '\0': '\\0', '\n': '\\n', '\r': '\\r',
+                             '\x1a': '\\Z'})
+
+# SQL literal renderer per Python type produced by the generators
+LITERAL_ENCODERS = {
+    type(None): lambda v: 'NULL',
+    bool: lambda v: '1' if v else '0',
+    int: str,
+    float: repr,
+    str: lambda v: "'" + v.translate(SQL_ESCAPES) + "'",
+    bytes: lambda v: "X'" + v.hex() + "'",
+    datetime: lambda v: f"'{v.isoformat(' ')}'",
+    date: lambda v: f"'{v.isoformat()}'",
+    time: lambda v: f"'{v.isoformat()}'",
+}
+
+def insert_rows(cur, insert_sql, batch, max_length):
+    """
+    Send a batch as hand-built multi-row INSERTs of at most `max_length`
+    bytes. Rendering literals straight from a type lookup skips the
+    driver's per-parameter escape and %-formatting passes of executemany.
+    """
+    head = insert_sql[:insert_sql.index('VALUES')] + 'VALUES '
+    # max_allowed_packet is a byte limit, so sizes are counted in UTF-8 bytes;
+    # ASCII literals (most of them) are one byte per character and skip the encode
+    head_size = len(head.encode())
+    values, size = [], head_size
+    for row in batch:
+        literal = '(' + ','.join([LITERAL_ENCODERS[type(v)](v) for v in row]) + ')'
+        literal_size = len(literal) if literal.isascii() else len(literal.encode())
+        if values and size + literal_size + 1 > max_length:
+            cur.execute(head + ','.join(values))
+            values, size = [], head_size
+        values.append(literal)
+        size += literal_size + 1
+    if values:
+        cur.execute(head + ','.join(values))
+
+def produce_batches(gen_fn, total_records, batch_size, batches):
+    """
+    Generate row batches on a background thread and hand them over through
+    `batches`, so building the next batch overlaps with loading the current one.
+    A trailing None marks the end; an exception is forwarded to the consumer.
+    """
     try:
-        for table_name, ddl, insert_sql, gen_fn in TABLE_CONFIG:
-            print(f"\n{'='*60}")
-            print(f"  Processing table: {table_name}")
-            print(f"{'='*60}")
-
-            # Ensure a clean table exists
-            ensure_table(conn, table_name, ddl)
-
-            inserted = 0
-            for batch_start in range(0, total_records, batch_size):
-                batch_end = min(batch_start + batch_size, total_records)
-                batch = [gen_fn(i) for i in range(batch_start, batch_end)]
-                with conn.cursor() as cur:
-                    cur.executemany(insert_sql, batch)
-                conn.commit()
-                inserted += len(batch)
-                print(f"  [{table_name}] Inserted {inserted}/{total_records}")
-
-            print(f"  Completed {table_name}: {inserted} records total.")
+        for batch_start in range(0, total_records, batch_size):
+            batch_end = min(batch_start + batch_size, total_records)
+            # One clock read per batch; rows in a batch share the same "now"
+            now = datetime.now()
+            batches.put([gen_fn(i, now) for i in range(batch_start, batch_end)])
+    except Exception as e:
+        batches.put(e)
+        return
+    batches.put(None)
+
+def create_indexes(conn, table_name, indexes):
+    """Build a table's secondary indexes once its rows are loaded"""
+    print(f"  Creating {len(indexes)} indexes on {table_name}...")
+    with conn.cursor() as cur:
+        for stmt in indexes:
+            cur.execute(stmt)
+
+def seed_worker():
+    """Reseed a loader process; forked workers would otherwise share one random state"""
+    random.seed()
+
+def load_table(conn_kwargs, table_config, total_records, batch_size, local_infile=True,
+               prefetch_batches=2):
+    """Create one table and load its generated rows over a dedicated connection"""
+    table_name, ddl, indexes, insert_sql, gen_fn = table_config
+    conn = mysql_driver.connect(**conn_kwargs, local_infile=local_infile)
+    try:
+        print(f"  Processing table: {table_name}")
+
+        # Bulk-load session: skip secondary unique-index and foreign-key checks.
+        # innodb_flush_log_at_trx_commit and sql_log_bin are global/privileged,
+        # so instead each table is committed once rather than once per batch.
+        with conn.cursor() as cur:
+            cur.execute("SET SESSION unique_checks = 0")
+            cur.execute("SET SESSION foreign_key_checks = 0")
+
+        # Ensure a clean table exists
+        ensure_table(conn, table_name, ddl)
+        load_sql = build_load_data(table_name, insert_sql, ddl)
+
+        # Bounded queue: at most `prefetch_batches` batches are generated ahead of the load
+        batches = queue.Queue(maxsize=max(prefetch_batches, 1))
+        producer = threading.Thread(target=produce_batches, daemon=True,
+                                    args=(gen_fn, total_records, batch_size, batches))
+        producer.start()
+
+        # One transaction per table: a single redo-log flush instead of one per batch.
+        # A single cursor serves every batch of the table.
+        inserted = 0
+        try:
+            with conn.cursor() as cur:
+                stmt_limit = None
+                while (batch := batches.get()) is not None:
+                    if isinstance(batch, Exception):
+                        raise batch
+                    if local_infile:
+                        try:
+                            load_batch(cur, load_sql, batch)
+                        except mysql_driver.MySQLError as e:
+                            if e.args[0] not in LOCAL_INFILE_DISABLED:
+                                raise
+                            # Server started without --local-infile: fall back to INSERTs
+                            print(f"  [{table_name}] LOCAL INFILE is disabled ({e.args[1]}); "
+                                  f"using INSERT batches.")
+                            local_infile = False
+                    if not local_infile:
+                        # Only the INSERT fallback needs the packet size
+                        if stmt_limit is None:
+                            stmt_limit = insert_statement_limit(cur)
+                        insert_rows(cur, insert_sql, batch, stmt_limit)
+                    inserted += len(batch)
+                    print(f"  [{table_name}] Inserted {inserted}/{total_records}")
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        producer.join()
+
+        create_indexes(conn, table_name, indexes)
+        print(f"  Completed {table_name}: {inserted} records total.")
     finally:
         conn.close()
 
+def run(host, user, password, database, port=3306, total_records=1000, batch_size=100,
+        local_infile=True, prefetch_batches=2):
+    conn_kwargs = dict(host=host, user=user, password=password, database=database,
+                       port=port, charset='utf8mb4')
+
+    # The tables are independent, so each one is loaded by its own process (and GIL)
+    # on its own connection
+    print(f"\n{'='*60}")
+    print(f"  Loading {len(TABLE_CONFIG)} tables in parallel")
+    print(f"{'='*60}")
+    with ProcessPoolExecutor(max_workers=len(TABLE_CONFIG), initializer=seed_worker) as pool:
+        futures = [pool.submit(load_table, conn_kwargs, table_config, total_records,
+                               batch_size, local_infile, prefetch_batches)
+                   for table_config in TABLE_CONFIG]
+        for future in futures:
+            future.result()
+
     print(f"\nAll tables populated successfully.")
 
 
@@ -642,7 +923,7 @@ def main():
         database="citadel",
         port=3306,
         total_records=5000,
-        batch_size=500
+        batch_size=5000
     )
 
 if __name__ == "__main__":
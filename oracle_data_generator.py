@@ -13,13 +13,17 @@
 import oracledb
 import random
 import string
-from decimal import Decimal
 from datetime import datetime, date, timedelta, time
 import uuid
 import json
-import ipaddress
+import multiprocessing
+import operator
 import os
 import sys
+import queue
+import threading
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
 
 # -------------------------------------------------------------------------------------
 COUNTRIES = ['USA','Germany','Japan','China','Brazil','India','UK','France',
@@ -50,80 +54,189 @@ CATEGORIES = {
 BRANDS = ['Bosch','3M','Siemens','ABB','Schneider','Honeywell','TE Connectivity','Parker']
 COLORS = ['Red','Blue','Green','Black','White','Silver','Yellow','Orange','Gray']
 
+# Choice pools used by the generators, built once instead of as list literals per row
+PAYMENT_TERMS = ['NET30','NET60','DUE_ON_RECEIPT','NET15']
+INVOICE_STATUSES = ['DRAFT','SENT','PAID','OVERDUE','CANCELLED']
+GENDERS = ['Male','Female','Non-Binary','Prefer Not to Say']
+EMPLOYMENT_TYPES = ['Full-Time','Part-Time','Contract','Intern']
+PROBATION_INTERVALS = ['+00-03','+00-06']                    # INTERVAL YEAR TO MONTH: 3 / 6 months
+ADDRESS_CITIES = ['Tokyo','Berlin','Mumbai','NYC']
+THEMES = ['dark','light']
+LANGUAGES = ['en','de','ja','hi']
+SENSOR_ERROR_CODES = [0,0,0,1,2,99]                           # mostly 0
+SENSOR_LABELS = ['temp','humidity','pressure','vibration']
+SENSOR_MANUFACTURERS = ['Bosch','Siemens','Honeywell']
+# Every category has the same number of subcategories, so one draw over the flat
+# (category, subcategory) pairs matches drawing a category and then a subcategory
+CATEGORY_PAIRS = [(cat, subcat) for cat, subcats in CATEGORIES.items() for subcat in subcats]
+SKU_PREFIXES = [cat[:3].upper() for cat in CATEGORIES]
+PRODUCT_LINES = ['Pro','Standard','Elite']
+PRODUCT_TAGS = ['industrial','premium','sale','new','eco','certified']
+MATERIALS = ['Steel','Aluminum','Plastic']
+IP_RATINGS = ['IP54','IP65','IP67','IP68']
+SHIP_CLASSES = ['Standard','Oversize','Hazmat']
+MARGIN_TIERS = ['Margin tier A','Margin tier B','Margin tier C']
+
+# Name-derived and small-domain strings are formatted once here; rows pick or
+# look up a ready-made string instead of building it per row
+CUSTOMER_NAMES = [f"Customer {i} Corp." for i in range(1, 1001)]
+SALES_REPS = [f"SalesRep-{i}" for i in range(1, 51)]
+PROJECT_CODES = [f"PROJ-{i}" for i in range(1000, 10000)]
+COST_CENTERS = [f"CC-{i}" for i in range(100, 1000)]
+FULL_NAMES = [f"{fn} {ln}" for fn in FIRST_NAMES for ln in LAST_NAMES]
+EMAIL_LOCAL_PARTS = {(fn, ln): f"{fn.lower()}.{ln.lower()}"
+                     for fn in FIRST_NAMES for ln in LAST_NAMES}
+EXPERIENCE_BIOS = [f"Experienced {title.lower()} with {years} years."
+                   for title in JOB_TITLES for years in range(1, 21)]
+
+def coin():
+    # Single C-level draw for a 50/50 NUMBER(1) flag
+    return random.getrandbits(1)
+
+ALNUM = string.ascii_letters + string.digits
+
 def rand_str(n=8):
-    return ''.join(random.choices(string.ascii_letters + string.digits, k=n))
+    return ''.join(random.choices(ALNUM, k=n))
 
-def rand_ipv4():
-    return str(ipaddress.IPv4Address(random.randint(0x0A000001, 0x0AFFFFFF)))
+def rand_ipv4(_randrange=random.randrange):
+    # 10.0.0.1-10.255.255.255 formatted directly, without an IPv4Address object
+    host = _randrange(1, 1 << 24)
+    return f"10.{host >> 16}.{host >> 8 & 255}.{host & 255}"
 
 def rand_mac():
-    return ':'.join(f'{random.randint(0,255):02x}' for _ in range(6))
+    return random.getrandbits(48).to_bytes(6, 'big').hex(':')
+
+# Random bytes drawn once; BLOB/RAW columns take windows of it at random offsets
+BLOB_POOL = os.urandom(1 << 20)
+
+def rand_blob(n):
+    offset = random.randrange(len(BLOB_POOL) - n + 1)
+    return BLOB_POOL[offset:offset + n]
+
+def rand_uuid():
+    # Version-4 UUID from the Mersenne Twister: no /dev/urandom read per row
+    return uuid.UUID(int=random.getrandbits(128), version=4)
+
+# Compact encoder built once: skips json.dumps' per-call option handling and
+# drops the padding spaces from every JSON column
+dump_json = json.JSONEncoder(separators=(',', ':')).encode
+
+# Pool entries pre-encoded as JSON strings for the multi-valued *_json columns
+SKILL_TOKENS = [dump_json(skill) for skill in SKILLS_POOL]
+CERT_TOKENS = [dump_json(cert) for cert in CERTS_POOL]
+SENSOR_LABEL_TOKENS = [dump_json(label) for label in SENSOR_LABELS]
+PRODUCT_TAG_TOKENS = [dump_json(tag) for tag in PRODUCT_TAGS]
+COLOR_TOKENS = [dump_json(color) for color in COLORS]
 
-def rand_semver():
-    return f"{random.randint(0,9)}.{random.randint(0,99)}.{random.randint(0,999)}"
+def json_sample(tokens, k, _sample=random.sample):
+    # JSON array of k distinct pre-encoded tokens: one sample, no per-row encoding
+    return f"[{','.join(_sample(tokens, k))}]"
+
+def rand_semver(_randint=random.randint):
+    return f"{_randint(0,9)}.{_randint(0,99)}.{_randint(0,999)}"
 
 
 # =====================================================================================
 # Database Helper: Ensure a clean table exists for data generation
 # =====================================================================================
-def ensure_table(conn, table_name, ddl, indexes=None):
+# Existence check, DROP and CREATE run server-side in one anonymous block,
+# so rebuilding a table costs a single round trip
+ENSURE_TABLE_PLSQL = """
+DECLARE
+    n NUMBER;
+BEGIN
+    SELECT COUNT(*) INTO n FROM user_tables WHERE table_name = UPPER(:tn);
+    IF n > 0 THEN
+        EXECUTE IMMEDIATE 'DROP TABLE ' || :tn || ' CASCADE CONSTRAINTS';
+    END IF;
+    EXECUTE IMMEDIATE :ddl;
+    :dropped := n;
+END;
+"""
+
+def ensure_table(conn, table_name, ddl):
     """
     Ensures that a specified table exists in the database with the latest schema.
     
     If the table already exists, it is dropped (along with any dependent 
     constraints) to prevent schema conflicts or stale data during the seeding 
-    process. After ensuring a clean slate, the table is created fresh and any 
-    specified indexes are applied.
+    process. After ensuring a clean slate, the table is created fresh. Its
+    indexes are built separately by `create_indexes` once the rows are loaded.
+
+    The existence check, DROP and CREATE are sent as one PL/SQL block
+    (`ENSURE_TABLE_PLSQL`) instead of three separate statements.
 
     Args:
         conn (oracledb.Connection): The active Oracle database connection object.
         table_name (str): The name of the table to check and create.
         ddl (str): The SQL Data Definition Language (CREATE TABLE) statement.
-        indexes (list of str, optional): A list of SQL statements to create indexes.
     """
     # Open a cursor to interact with the database context safely
     with conn.cursor() as cur:
         
-        # Query Oracle's data dictionary (user_tables) to check if the table exists.
-        # We use a bind variable (:tn) for safety and UPPER() since Oracle 
-        # stores table names in uppercase by default.
-        cur.execute("SELECT COUNT(*) FROM user_tables WHERE table_name = UPPER(:tn)", tn=table_name)
-        
-        # fetchone() returns a tuple. Grab the first element (the count) to evaluate existence.
-        exists = cur.fetchone()[0] > 0
+        # Output bind: the block reports back whether an old table was dropped
+        dropped = cur.var(int)
         
-        # If the table is found, perform a clean teardown before rebuilding it.
-        if exists:
-            print(f"  Table {table_name} already exists. Dropping old table...")
-            # CASCADE CONSTRAINTS drops the table even if foreign keys reference it
-            cur.execute(f"DROP TABLE {table_name} CASCADE CONSTRAINTS")
-            
-        # Execute the provided DDL string to create the table from scratch
+        # Query user_tables, drop the old table if present (CASCADE CONSTRAINTS drops
+        # it even if foreign keys reference it) and create it from scratch, all in
+        # one round trip. The DDL goes in as a bind and runs via EXECUTE IMMEDIATE.
         print(f"  Creating table {table_name}...")
-        cur.execute(ddl)
+        cur.execute(ENSURE_TABLE_PLSQL, tn=table_name, ddl=ddl, dropped=dropped)
+        if dropped.getvalue():
+            print(f"  Table {table_name} already existed; old table dropped.")
         
-        # If a list of index creation statements was provided, apply them sequentially
-        if indexes:
-            for idx_sql in indexes:
-                try:
-                    cur.execute(idx_sql)
-                except Exception as e:
-                    # Catch and log exceptions (like syntax errors or edge-case duplicates)
-                    # so a minor index issue doesn't crash the entire generation run.
-                    print(f"    Index note: {e}")
-                    
-        # Commit the transaction so the drop/create operations are saved
-        conn.commit()
+        # DDL commits implicitly in Oracle, so no explicit COMMIT round trip is needed
         print(f"  Table {table_name} ready.")
 
 
+def create_indexes(conn, table_name, indexes):
+    """
+    Builds a table's secondary indexes after its rows have been loaded.
+
+    Creating the indexes on a populated table lets Oracle build each one with a
+    single full scan and sort, instead of maintaining every B-tree on each
+    inserted row. The build runs in parallel; the index is switched back to
+    NOPARALLEL afterwards so later queries don't inherit the degree.
+
+    All statements run server-side from one anonymous PL/SQL block, so the
+    whole set costs a single round trip. Each index gets its own exception
+    handler; the error messages come back through an OUT bind.
+
+    Args:
+        conn (oracledb.Connection): The active Oracle database connection object.
+        table_name (str): The name of the table the indexes belong to.
+        indexes (list of str): CREATE INDEX statements for the table.
+    """
+    print(f"  Creating {len(indexes)} indexes on {table_name}...")
+    steps = []
+    for idx_sql in indexes:
+        index_name = idx_sql.split()[2]
+        create_sql = f"{idx_sql} PARALLEL".replace("'", "''")
+        # Catch and log exceptions (like syntax errors or edge-case duplicates)
+        # so a minor index issue doesn't crash the entire generation run.
+        steps.append(f"  BEGIN\n"
+                     f"    EXECUTE IMMEDIATE '{create_sql}';\n"
+                     f"    EXECUTE IMMEDIATE 'ALTER INDEX {index_name} NOPARALLEL';\n"
+                     f"  EXCEPTION WHEN OTHERS THEN\n"
+                     f"    :notes := :notes || SQLERRM || CHR(10);\n"
+                     f"  END;\n")
+    with conn.cursor() as cur:
+        notes = cur.var(str, 4000)
+        cur.execute(f"BEGIN\n{''.join(steps)}END;", notes=notes)
+        for note in (notes.getvalue() or '').splitlines():
+            print(f"    Index note: {note}")
+
+
 # =====================================================================================
 # TABLE 1: invoices
 # =====================================================================================
 INVOICES_DDL = """
 CREATE TABLE invoices (
     invoice_id          NUMBER GENERATED ALWAYS AS IDENTITY PRIMARY KEY,
-    invoice_number      VARCHAR2(50) NOT NULL UNIQUE,
+    invoice_number      VARCHAR2(50) GENERATED ALWAYS AS (
+                            'INV-' || TO_CHAR(invoice_date, 'YYYYMM') || '-' ||
+                            LPAD(TO_CHAR(invoice_id), GREATEST(LENGTH(TO_CHAR(invoice_id)), 6), '0')
+                        ) VIRTUAL NOT NULL UNIQUE,
     customer_id         NUMBER NOT NULL,
     customer_code       VARCHAR2(20) NOT NULL,
     customer_name       VARCHAR2(255) NOT NULL,
@@ -177,8 +290,8 @@ INVOICES_IDX = [
     "CREATE INDEX idx_inv_status ON invoices(status)",
 ]
 INVOICES_INSERT = """
-INSERT INTO invoices (
-    invoice_number, customer_id, customer_code, customer_name, customer_address,
+INSERT /*+ APPEND_VALUES */ INTO invoices (
+    customer_id, customer_code, customer_name, customer_address,
     billing_country, shipping_country, currency_code, payment_terms, sales_representative,
     total_amount, tax_amount, discount_amount, shipping_cost, subtotal_amount,
     items_count, revision_number, processing_days, exchange_rate, tax_rate,
@@ -188,56 +301,62 @@ INSERT INTO invoices (
     project_code, cost_center, manufacturing_plant, quality_check_passed, compliance_verified
 ) VALUES (
     :1,:2,:3,:4,:5,:6,:7,:8,:9,:10,:11,:12,:13,:14,:15,:16,:17,:18,:19,:20,
-    :21,:22,:23,:24,:25,:26,:27,:28,:29,:30,:31,:32,:33,:34,:35,:36,:37,:38,:39,:40,:41
+    :21,:22,:23,:24,:25,:26,:27,:28,:29,:30,:31,:32,:33,:34,:35,:36,:37,:38,:39,:40
 )
 """
 
-def gen_invoice(idx):
-    billing = random.choice(COUNTRIES)
-    shipping = random.choice(COUNTRIES)
-    items_count = random.randint(1, 15)
-    items, subtotal = [], Decimal('0.00')
-    for j in range(items_count):
-        up = Decimal(str(round(random.uniform(10, 1000), 2)))
-        qty = random.randint(1, 50)
-        total = up * qty
-        items.append({'item_id': j+1, 'product_code': f"PROD-{random.randint(1000,9999)}",
-                      'quantity': qty, 'unit_price': float(up), 'total_amount': float(total)})
-        subtotal += total
-    discount = Decimal(str(round(random.uniform(0, min(float(subtotal*Decimal('0.2')), 500)), 2)))
-    ship_cost = Decimal(str(round(random.uniform(0, 200), 2)))
-    tax_rate = round(random.uniform(0.05, 0.25), 3)
-    tax_amt = (subtotal - discount) * Decimal(str(tax_rate))
+# Line items are filled into a fixed-shape JSON template rather than built as
+# dicts and encoded; %s on a float gives the same repr the JSON encoder writes
+INVOICE_ITEM = ('{"item_id":%d,"product_code":"PROD-%d","quantity":%d,'
+                '"unit_price":%s,"total_amount":%s}')
+
+def gen_invoice(idx, now, _choice=random.choice, _randint=random.randint,
+                _uniform=random.uniform):
+    billing = _choice(COUNTRIES)
+    shipping = _choice(COUNTRIES)
+    items_count = _randint(1, 15)
+    # Money is kept in integer cents: exact like Decimal, but plain int arithmetic
+    # Line items as parallel columns: the products and their sum run in C (map/sum)
+    # and each line total is computed once for both the subtotal and the JSON
+    prices = [_randint(1000, 100000) for _ in range(items_count)]
+    qtys = [_randint(1, 50) for _ in range(items_count)]
+    totals = list(map(operator.mul, prices, qtys))
+    subtotal = sum(totals)
+    items = ','.join([INVOICE_ITEM % (j, _randint(1000,9999), qty, up / 100, total / 100)
+                      for j, up, qty, total in zip(range(1, items_count + 1), prices, qtys, totals)])
+    discount = _randint(0, min(subtotal // 5, 50000))
+    ship_cost = _randint(0, 20000)
+    tax_rate = round(_uniform(0.05, 0.25), 3)
+    tax_amt = round((subtotal - discount) * tax_rate)
     total_amt = subtotal - discount + tax_amt + ship_cost
-    base_dt = date.today() - timedelta(days=random.randint(0, 365))
-    created = datetime.now() - timedelta(days=random.randint(0, 30))
-    pay_dt = created - timedelta(days=random.randint(1,15)) if random.random() > 0.5 else None
-    ship_dt = created - timedelta(days=random.randint(1,10)) if random.random() > 0.5 else None
-    appr_dt = created - timedelta(days=random.randint(1,5)) if random.random() > 0.5 else None
+    base_dt = now.date() - timedelta(days=_randint(0, 365))
+    created = now - timedelta(days=_randint(0, 30))
+    pay_dt = created - timedelta(days=_randint(1,15)) if coin() else None
+    ship_dt = created - timedelta(days=_randint(1,10)) if coin() else None
+    appr_dt = created - timedelta(days=_randint(1,5)) if coin() else None
 
     return (
-        f"INV-{date.today().strftime('%Y%m')}-{idx+1:06d}",
-        random.randint(1000,9999), f"CUST-{random.randint(10000,99999)}",
-        f"Customer {random.randint(1,1000)} Corp.",
-        f"{random.randint(1,9999)} Main St, City {random.randint(1,100)}, {billing}",
-        billing, shipping, random.choice(CURRENCIES),
-        random.choice(['NET30','NET60','DUE_ON_RECEIPT','NET15']),
-        f"SalesRep-{random.randint(1,50)}",
-        float(total_amt), float(tax_amt), float(discount), float(ship_cost), float(subtotal),
-        items_count, random.randint(0,5), random.randint(1,10),
-        round(random.uniform(0.8,1.2), 4), tax_rate,
-        1 if random.random()>0.5 else 0, 1 if random.random()>0.5 else 0,
-        1 if random.random()>0.5 else 0, 1 if random.random()>0.5 else 0,
+        _randint(1000,9999), f"CUST-{_randint(10000,99999)}",
+        _choice(CUSTOMER_NAMES),
+        f"{_randint(1,9999)} Main St, City {_randint(1,100)}, {billing}",
+        billing, shipping, _choice(CURRENCIES),
+        _choice(PAYMENT_TERMS),
+        _choice(SALES_REPS),
+        total_amt / 100, tax_amt / 100, discount / 100, ship_cost / 100, subtotal / 100,
+        items_count, _randint(0,5), _randint(1,10),
+        round(_uniform(0.8,1.2), 4), tax_rate,
+        coin(), coin(),
+        coin(), coin(),
         1 if billing != shipping else 0,
-        base_dt, base_dt + timedelta(days=random.randint(15,90)),
+        base_dt, base_dt + timedelta(days=_randint(15,90)),
         created, pay_dt, ship_dt, appr_dt,
-        random.choice(TIMEZONES_LIST), json.dumps(items),
-        bytes(random.getrandbits(8) for _ in range(64)),
-        json.dumps({'version':'1.0','batch_id': str(uuid.uuid4())}),
-        random.choice(['DRAFT','SENT','PAID','OVERDUE','CANCELLED']),
-        f"PROJ-{random.randint(1000,9999)}", f"CC-{random.randint(100,999)}",
-        random.choice(PLANTS),
-        1 if random.random()>0.5 else 0, 1 if random.random()>0.5 else 0
+        _choice(TIMEZONES_LIST), f"[{items}]",
+        rand_blob(64),
+        dump_json({'version':'1.0','batch_id': str(rand_uuid())}),
+        _choice(INVOICE_STATUSES),
+        _choice(PROJECT_CODES), _choice(COST_CENTERS),
+        _choice(PLANTS),
+        coin(), coin()
     )
 
 
@@ -249,7 +368,9 @@ CREATE TABLE employees (
     employee_id         NUMBER GENERATED ALWAYS AS IDENTITY PRIMARY KEY,
     employee_uuid       VARCHAR2(36) NOT NULL,
     employee_uuid_raw   RAW(16),
-    employee_code       VARCHAR2(20) NOT NULL UNIQUE,
+    employee_code       VARCHAR2(20) GENERATED ALWAYS AS (
+                            'EMP-' || LPAD(TO_CHAR(employee_id), GREATEST(LENGTH(TO_CHAR(employee_id)), 6), '0')
+                        ) VIRTUAL NOT NULL UNIQUE,
     first_name          VARCHAR2(100) NOT NULL,
     last_name           VARCHAR2(100) NOT NULL,
     email               VARCHAR2(255) NOT NULL,
@@ -297,8 +418,8 @@ EMPLOYEES_IDX = [
     "CREATE INDEX idx_emp_active ON employees(is_active)",
 ]
 EMPLOYEES_INSERT = """
-INSERT INTO employees (
-    employee_uuid, employee_uuid_raw, employee_code, first_name, last_name,
+INSERT /*+ APPEND_VALUES */ INTO employees (
+    employee_uuid, employee_uuid_raw, first_name, last_name,
     email, phone_number, gender, employment_type, department, job_title, job_level,
     base_salary, bonus_pct, stock_options, years_experience, employee_rating, badge_number,
     is_active, is_manager, has_remote_access, background_check_ok,
@@ -311,56 +432,57 @@ INSERT INTO employees (
 ) VALUES (
     :1,:2,:3,:4,:5,:6,:7,:8,:9,:10,:11,:12,:13,:14,:15,:16,:17,:18,
     :19,:20,:21,:22,:23,:24,:25,:26,:27,:28,:29,:30,:31,:32,:33,
-    :34,:35,:36,:37,:38,:39,:40,:41,:42
+    :34,:35,:36,:37,:38,:39,:40,:41
 )
 """
 
-def gen_employee(idx):
-    fn = random.choice(FIRST_NAMES)
-    ln = random.choice(LAST_NAMES)
-    emp_uuid = uuid.uuid4()
-    dob = date(random.randint(1960,2002), random.randint(1,12), random.randint(1,28))
-    hire = date(random.randint(2010,2025), random.randint(1,12), random.randint(1,28))
-    term = hire + timedelta(days=random.randint(180,1800)) if random.random() < 0.15 else None
-    tenure_days = random.randint(30, 3650)
+def gen_employee(idx, now, _choice=random.choice, _randint=random.randint,
+                 _uniform=random.uniform, _random=random.random):
+    fn = _choice(FIRST_NAMES)
+    ln = _choice(LAST_NAMES)
+    emp_uuid = rand_uuid()
+    dob = date(_randint(1960,2002), _randint(1,12), _randint(1,28))
+    hire = date(_randint(2010,2025), _randint(1,12), _randint(1,28))
+    term = hire + timedelta(days=_randint(180,1800)) if _random() < 0.15 else None
+    tenure_days = _randint(30, 3650)
 
     return (
         str(emp_uuid),
         emp_uuid.bytes,                                     # RAW(16)
-        f"EMP-{idx+1:06d}", fn, ln,
-        f"{fn.lower()}.{ln.lower()}{random.randint(1,99)}@example.com",
-        f"+{random.randint(1,99)}-{random.randint(100,999)}-{random.randint(1000,9999)}",
-        random.choice(['Male','Female','Non-Binary','Prefer Not to Say']),
-        random.choice(['Full-Time','Part-Time','Contract','Intern']),
-        random.choice(DEPARTMENTS), random.choice(JOB_TITLES), random.randint(1,10),
-        float(round(random.uniform(30000,250000), 2)),
-        round(random.uniform(0,0.30), 4),
-        random.randint(0,50000), random.randint(0,35),
-        round(random.uniform(1.0,5.0), 6), random.randint(100000,999999),
-        1 if random.random()>0.5 else 0, 1 if random.random()>0.5 else 0,
-        1 if random.random()>0.5 else 0,
-        1 if random.random()>0.3 else 0,
+        fn, ln,
+        f"{EMAIL_LOCAL_PARTS[fn, ln]}{_randint(1,99)}@example.com",
+        f"+{_randint(1,99)}-{_randint(100,999)}-{_randint(1000,9999)}",
+        _choice(GENDERS),
+        _choice(EMPLOYMENT_TYPES),
+        _choice(DEPARTMENTS), _choice(JOB_TITLES), _randint(1,10),
+        _uniform(30000,250000),                             # NUMBER(12,2) rounds server-side
+        round(_uniform(0,0.30), 4),
+        _randint(0,50000), _randint(0,35),
+        round(_uniform(1.0,5.0), 6), _randint(100000,999999),
+        coin(), coin(),
+        coin(),
+        1 if _random()>0.3 else 0,
         dob, hire, term,
-        datetime(2025, 1, 1, random.randint(0,23), random.randint(0,59), random.randint(0,59)),
-        datetime(2025, 1, 1, random.randint(6,10), 0, 0),
-        datetime.now() - timedelta(days=random.randint(0,30)),
-        datetime.now() - timedelta(days=random.randint(0,10)),
-        f"+00-{random.choice([3,6]):02d}",                  # INTERVAL YEAR TO MONTH: '+00-03' = 3 months
+        datetime(2025, 1, 1, _randint(0,23), _randint(0,59), _randint(0,59)),
+        datetime(2025, 1, 1, _randint(6,10), 0, 0),
+        now - timedelta(days=_randint(0,30)),
+        now - timedelta(days=_randint(0,10)),
+        _choice(PROBATION_INTERVALS),
         f"+{tenure_days:09d} 08:00:00.000000",              # INTERVAL DAY TO SECOND
         rand_ipv4(), rand_mac(),
-        json.dumps(random.sample(SKILLS_POOL, k=random.randint(2,7))),
-        json.dumps(random.sample(CERTS_POOL, k=random.randint(0,4))),
-        json.dumps([random.randint(1000,9999) for _ in range(random.randint(1,5))]),
-        json.dumps({'street': f"{random.randint(1,9999)} Oak St",
-                    'city': random.choice(['Tokyo','Berlin','Mumbai','NYC']),
-                    'country': random.choice(COUNTRIES)}),
-        json.dumps({'name': f"{random.choice(FIRST_NAMES)} {random.choice(LAST_NAMES)}",
-                    'phone': f"+1-555-{random.randint(1000,9999)}"}),
-        json.dumps({'theme': random.choice(['dark','light']),
-                    'language': random.choice(['en','de','ja','hi'])}),
-        bytes(random.getrandbits(8) for _ in range(128)),
-        f"Experienced {random.choice(JOB_TITLES).lower()} with {random.randint(1,20)} years.",
-        f"Note: {rand_str(50)}" if random.random() > 0.5 else None
+        json_sample(SKILL_TOKENS, _randint(2,7)),
+        json_sample(CERT_TOKENS, _randint(0,4)),
+        dump_json([_randint(1000,9999) for _ in range(_randint(1,5))]),
+        dump_json({'street': f"{_randint(1,9999)} Oak St",
+                    'city': _choice(ADDRESS_CITIES),
+                    'country': _choice(COUNTRIES)}),
+        dump_json({'name': _choice(FULL_NAMES),
+                    'phone': f"+1-555-{_randint(1000,9999)}"}),
+        dump_json({'theme': _choice(THEMES),
+                    'language': _choice(LANGUAGES)}),
+        rand_blob(128),
+        _choice(EXPERIENCE_BIOS),
+        f"Note: {rand_str(50)}" if coin() else None
     )
 
 
@@ -411,7 +533,7 @@ SENSOR_IDX = [
     "CREATE INDEX idx_sr_anom   ON sensor_readings(is_anomaly)",
 ]
 SENSOR_INSERT = """
-INSERT INTO sensor_readings (
+INSERT /*+ APPEND_VALUES */ INTO sensor_readings (
     reading_uuid, device_id, device_serial, firmware_version,
     temperature_c, humidity_pct, pressure_hpa, voltage, current_amps, power_watts,
     latitude, longitude, altitude_m, signal_strength_dbm, error_code, uptime_seconds,
@@ -426,37 +548,40 @@ INSERT INTO sensor_readings (
 )
 """
 
-def gen_sensor_reading(idx):
-    ts = datetime.now() - timedelta(days=random.randint(0,90), hours=random.randint(0,23),
-                                     minutes=random.randint(0,59), seconds=random.randint(0,59))
+def gen_sensor_reading(idx, now, _choice=random.choice, _randint=random.randint,
+                       _uniform=random.uniform, _random=random.random):
+    ts = now - timedelta(days=_randint(0,90), hours=_randint(0,23),
+                         minutes=_randint(0,59), seconds=_randint(0,59))
     return (
-        str(uuid.uuid4()), f"DEV-{random.randint(1,200):04d}",
+        str(rand_uuid()), f"DEV-{_randint(1,200):04d}",
         rand_str(16).upper(), rand_semver(),
-        float(round(random.uniform(-40,85), 4)),
-        float(round(random.uniform(0,100), 3)),
-        float(round(random.uniform(900,1100), 4)),
-        round(random.uniform(0,48), 3), round(random.uniform(0,10), 8),
-        float(round(random.uniform(0,5000), 6)),
-        float(round(random.uniform(-90,90), 7)),
-        float(round(random.uniform(-180,180), 7)),
-        round(random.uniform(-50,5000), 2),
-        random.randint(-120,0), random.choice([0,0,0,1,2,99]),
-        random.randint(0, 10_000_000),
-        1 if random.random() < 0.05 else 0,
-        0 if random.random() < 0.02 else 1,
-        1 if random.random() < 0.1 else 0,
-        ts, ts + timedelta(milliseconds=random.randint(50,2000)),
+        # Fixed-scale NUMBER(p,s) columns: Oracle rounds to the column's scale on insert
+        _uniform(-40,85),
+        _uniform(0,100),
+        _uniform(900,1100),
+        round(_uniform(0,48), 3), round(_uniform(0,10), 8),
+        _uniform(0,5000),
+        _uniform(-90,90),
+        _uniform(-180,180),
+        round(_uniform(-50,5000), 2),
+        _randint(-120,0), _choice(SENSOR_ERROR_CODES),
+        _randint(0, 10_000_000),
+        1 if _random() < 0.05 else 0,
+        0 if _random() < 0.02 else 1,
+        1 if _random() < 0.1 else 0,
+        ts, ts + timedelta(milliseconds=_randint(50,2000)),
         ts, ts,  # reading_date (DATE) and reading_time (TIMESTAMP)
-        json.dumps([random.randint(1,500) for _ in range(random.randint(1,5))]),
-        json.dumps(random.sample(['temp','humidity','pressure','vibration'], k=random.randint(1,3))),
-        json.dumps([round(random.uniform(-50,150), 6) for _ in range(random.randint(5,20))]),
-        json.dumps({'manufacturer': random.choice(['Bosch','Siemens','Honeywell']),
-                    'model': f"M{random.randint(100,999)}"}),
-        json.dumps({'temp_high': round(random.uniform(50,80), 1)}),
-        bytes(random.getrandbits(8) for _ in range(random.randint(32,256))),
-        bytes(random.getrandbits(8) for _ in range(32)),     # RAW(32)
-        random.choice(SENSOR_LOCATIONS),
-        f"Reading #{idx+1}" if random.random() > 0.7 else None
+        dump_json([_randint(1,500) for _ in range(_randint(1,5))]),
+        json_sample(SENSOR_LABEL_TOKENS, _randint(1,3)),
+        # random() scaled inline: uniform() is a Python-level call per sample
+        dump_json([round(-50 + 200 * _random(), 6) for _ in range(_randint(5,20))]),
+        dump_json({'manufacturer': _choice(SENSOR_MANUFACTURERS),
+                    'model': f"M{_randint(100,999)}"}),
+        dump_json({'temp_high': round(_uniform(50,80), 1)}),
+        rand_blob(_randint(32,256)),
+        rand_blob(32),                                      # RAW(32)
+        _choice(SENSOR_LOCATIONS),
+        f"Reading #{idx+1}" if _random() > 0.7 else None
     )
 
 
@@ -467,7 +592,10 @@ CATALOG_DDL = """
 CREATE TABLE product_catalog (
     product_id          NUMBER GENERATED ALWAYS AS IDENTITY PRIMARY KEY,
     product_uuid        VARCHAR2(36) NOT NULL,
-    sku                 VARCHAR2(40) NOT NULL UNIQUE,
+    sku                 VARCHAR2(40) GENERATED ALWAYS AS (
+                            'SKU-' || UPPER(SUBSTR(category, 1, 3)) || '-' ||
+                            LPAD(TO_CHAR(product_id), GREATEST(LENGTH(TO_CHAR(product_id)), 6), '0')
+                        ) VIRTUAL NOT NULL UNIQUE,
     product_name        VARCHAR2(300) NOT NULL,
     category            VARCHAR2(100) NOT NULL,
     subcategory         VARCHAR2(100),
@@ -520,8 +648,8 @@ CATALOG_IDX = [
     "CREATE INDEX idx_cat_active ON product_catalog(is_active)",
 ]
 CATALOG_INSERT = """
-INSERT INTO product_catalog (
-    product_uuid, sku, product_name, category, subcategory, brand,
+INSERT /*+ APPEND_VALUES */ INTO product_catalog (
+    product_uuid, product_name, category, subcategory, brand,
     description_short, description_long,
     unit_price, wholesale_price, cost_price,
     weight_kg, length_cm, width_cm, height_cm, volume_cm3,
@@ -535,57 +663,84 @@ INSERT INTO product_catalog (
 ) VALUES (
     :1,:2,:3,:4,:5,:6,:7,:8,:9,:10,:11,:12,:13,:14,:15,:16,:17,:18,:19,:20,
     :21,:22,:23,:24,:25,:26,:27,:28,:29,:30,:31,:32,:33,:34,:35,:36,:37,:38,
-    :39,:40,:41,:42,:43,:44,:45,:46
+    :39,:40,:41,:42,:43,:44,:45
 )
 """
 
-def gen_product(idx):
-    cat = random.choice(list(CATEGORIES.keys()))
-    subcat = random.choice(CATEGORIES[cat])
-    brand = random.choice(BRANDS)
-    up = round(random.uniform(1,5000), 4)
-    ws = round(up * random.uniform(0.5,0.9), 4)
-    cp = round(ws * random.uniform(0.4,0.8), 4)
-    l, w, h = round(random.uniform(1,200),2), round(random.uniform(1,200),2), round(random.uniform(1,200),2)
-    launch = date(random.randint(2015,2025), random.randint(1,12), random.randint(1,28))
-    disc = launch + timedelta(days=random.randint(365,3650)) if random.random() < 0.1 else None
+def gen_product(idx, now, _choice=random.choice, _randint=random.randint,
+                _uniform=random.uniform, _random=random.random):
+    cat, subcat = _choice(CATEGORY_PAIRS)
+    brand = _choice(BRANDS)
+    # Prices are NUMBER(12,4): Oracle rounds them to the column's scale on insert
+    up = _uniform(1,5000)
+    ws = up * _uniform(0.5,0.9)
+    cp = ws * _uniform(0.4,0.8)
+    l, w, h = round(_uniform(1,200),2), round(_uniform(1,200),2), round(_uniform(1,200),2)
+    launch = date(_randint(2015,2025), _randint(1,12), _randint(1,28))
+    disc = launch + timedelta(days=_randint(365,3650)) if _random() < 0.1 else None
 
     return (
-        str(uuid.uuid4()), f"SKU-{cat[:3].upper()}-{idx+1:06d}",
-        f"{brand} {subcat} {random.choice(['Pro','Standard','Elite'])} {random.randint(100,999)}",
+        str(rand_uuid()),
+        f"{brand} {subcat} {_choice(PRODUCT_LINES)} {_randint(100,999)}",
         cat, subcat, brand,
         f"High-quality {subcat.lower()} for industrial use.",
-        f"Detailed description for {subcat} product by {brand}. " * random.randint(3,10),
+        f"Detailed description for {subcat} product by {brand}. " * _randint(3,10),
         up, ws, cp,
-        round(random.uniform(0.01,100), 3), l, w, h, round(l*w*h, 4),
-        random.randint(0,10000), random.randint(5,100), random.randint(50,5000),
-        round(random.uniform(0,100), 8),
-        float(round(random.uniform(1,5), 2)),
-        random.randint(0,5000), random.randint(0,1_000_000),
-        1 if random.random()>0.25 else 0, 1 if random.random()<0.1 else 0,
-        1 if random.random()<0.2 else 0, 1 if cat=='Chemicals' else 0,
-        1 if random.random()<0.3 else 0, 1 if random.random()<0.05 else 0,
-        launch, disc, date.today() - timedelta(days=random.randint(0,90)),
-        datetime.now() - timedelta(days=random.randint(0,60)), datetime.now(),
-        json.dumps(random.sample(['industrial','premium','sale','new','eco','certified'], k=random.randint(1,4))),
-        json.dumps(random.sample(COLORS, k=random.randint(1,4))),
-        json.dumps([f"SKU-{random.choice(list(CATEGORIES.keys()))[:3].upper()}-{random.randint(1,9999):06d}"
-                    for _ in range(random.randint(0,3))]),
-        json.dumps([random.randint(1,20) for _ in range(random.randint(1,4))]),
-        json.dumps({'material': random.choice(['Steel','Aluminum','Plastic']),
-                    'ip_rating': f"IP{random.choice([54,65,67,68])}"}),
-        json.dumps({'ship_class': random.choice(['Standard','Oversize','Hazmat']),
-                    'est_days': random.randint(1,14)}),
-        json.dumps({'supplier_id': f"SUP-{random.randint(100,999)}",
-                    'lead_time_days': random.randint(7,90)}),
-        json.dumps({'title': f"Buy {subcat} from {brand}"}),
-        bytes(random.getrandbits(8) for _ in range(64)),
-        f"Margin tier {random.choice(['A','B','C'])}" if random.random() > 0.6 else None,
-        random.choice(COUNTRIES),
-        f"{random.randint(1000,9999)}.{random.randint(10,99)}.{random.randint(10,99)}"
+        round(_uniform(0.01,100), 3), l, w, h, round(l*w*h, 4),
+        _randint(0,10000), _randint(5,100), _randint(50,5000),
+        round(_uniform(0,100), 8),
+        _uniform(1,5),                                      # NUMBER(3,2)
+        _randint(0,5000), _randint(0,1_000_000),
+        1 if _random()>0.25 else 0, 1 if _random()<0.1 else 0,
+        1 if _random()<0.2 else 0, 1 if cat=='Chemicals' else 0,
+        1 if _random()<0.3 else 0, 1 if _random()<0.05 else 0,
+        launch, disc, now.date() - timedelta(days=_randint(0,90)),
+        now - timedelta(days=_randint(0,60)), now,
+        json_sample(PRODUCT_TAG_TOKENS, _randint(1,4)),
+        json_sample(COLOR_TOKENS, _randint(1,4)),
+        dump_json([f"SKU-{_choice(SKU_PREFIXES)}-{_randint(1,9999):06d}"
+                    for _ in range(_randint(0,3))]),
+        dump_json([_randint(1,20) for _ in range(_randint(1,4))]),
+        dump_json({'material': _choice(MATERIALS),
+                    'ip_rating': _choice(IP_RATINGS)}),
+        dump_json({'ship_class': _choice(SHIP_CLASSES),
+                    'est_days': _randint(1,14)}),
+        dump_json({'supplier_id': f"SUP-{_randint(100,999)}",
+                    'lead_time_days': _randint(7,90)}),
+        dump_json({'title': f"Buy {subcat} from {brand}"}),
+        rand_blob(64),
+        _choice(MARGIN_TIERS) if _random() > 0.6 else None,
+        _choice(COUNTRIES),
+        f"{_randint(1000,9999)}.{_randint(10,99)}.{_randint(10,99)}"
     )
 
 
+# =====================================================================================
+# Bind types
+# =====================================================================================
+# LOB columns are bound as LONG / LONG RAW: the values travel inline with the
+# row array instead of as temporary LOBs written in extra round trips per row
+LOB_BIND_TYPES = {'CLOB': oracledb.DB_TYPE_LONG, 'BLOB': oracledb.DB_TYPE_LONG_RAW}
+
+def insert_columns(insert_sql):
+    """Extract the target column names from a parameterized INSERT statement"""
+    head = insert_sql[:insert_sql.rindex('VALUES')]
+    column_list = head[head.rindex('(') + 1:head.rindex(')')]
+    return [col.strip() for col in column_list.split(',')]
+
+def lob_input_sizes(ddl, insert_sql):
+    """
+    Positional input sizes for an INSERT: LOB columns get their inline bind
+    type, every other column is left to python-oracledb's inference (None).
+    """
+    column_types = {}
+    for line in ddl.splitlines():
+        parts = line.split()
+        if len(parts) > 1:
+            column_types[parts[0]] = parts[1].rstrip(',')
+    return [LOB_BIND_TYPES.get(column_types.get(col)) for col in insert_columns(insert_sql)]
+
+
 # =====================================================================================
 # Runner
 # =====================================================================================
@@ -596,28 +751,112 @@ TABLE_CONFIG = [
     ('product_catalog', CATALOG_DDL,   CATALOG_IDX,   CATALOG_INSERT,   gen_product),
 ]
 
-def run(user, password, dsn, total_records=1000, batch_size=100):
+def start_gen_pool(gen_workers):
+    """
+    Start the batch-generation processes before the producer thread exists.
+    They are spawned, not forked: the pool starts workers lazily, and forking
+    from the producer thread while the main thread is inside an oracledb call
+    can deadlock the child. Spawned workers also get their own random state.
+    """
+    gen_pool = ProcessPoolExecutor(max_workers=gen_workers,
+                                   mp_context=multiprocessing.get_context('spawn'))
+    # One task per worker brings the whole pool up now, from the main thread
+    for future in [gen_pool.submit(os.getpid) for _ in range(gen_workers)]:
+        future.result()
+    return gen_pool
+
+def generate_batch(gen_fn, batch_start, batch_end):
+    """Build the rows [batch_start, batch_end) of a table as a list"""
+    # One clock read per batch; rows in a batch share the same "now"
+    now = datetime.now()
+    return [gen_fn(i, now) for i in range(batch_start, batch_end)]
+
+def produce_batches(gen_fn, total_records, batch_size, batches, gen_pool=None):
+    """
+    Generate row batches on a background thread and hand them over through
+    `batches`, so building the next batch overlaps with sending the current one.
+    With `gen_pool` the batches are built in worker processes instead, keeping
+    up to `batches.maxsize` of them in flight. A trailing None marks the end;
+    an exception is forwarded to the consumer.
+    """
+    try:
+        pending = deque()
+        for batch_start in range(0, total_records, batch_size):
+            batch_end = min(batch_start + batch_size, total_records)
+            if gen_pool is None:
+                batches.put(generate_batch(gen_fn, batch_start, batch_end))
+                continue
+            pending.append(gen_pool.submit(generate_batch, gen_fn, batch_start, batch_end))
+            if len(pending) >= batches.maxsize:
+                batches.put(pending.popleft().result())
+        while pending:
+            batches.put(pending.popleft().result())
+    except Exception as e:
+        batches.put(e)
+        return
+    batches.put(None)
+
+def run(user, password, dsn, total_records=1000, batch_size=100, prefetch_batches=2,
+        gen_workers=0):
     conn = oracledb.connect(user=user, password=password, dsn=dsn)
+
+    # Direct-path loads commit every batch; a seed run doesn't need each of those
+    # commits to wait for its redo to reach disk (this session only). The larger
+    # session cursor cache keeps the repeated INSERT/DDL cursors soft-parsed.
+    with conn.cursor() as cur:
+        cur.execute("ALTER SESSION SET COMMIT_LOGGING = BATCH COMMIT_WAIT = NOWAIT "
+                    "SESSION_CACHED_CURSORS = 200 CURSOR_SHARING = EXACT")
+
+    # Row generation is pure-Python CPU work; with `gen_workers` the batches are
+    # built in worker processes while this process keeps the connection busy
+    gen_pool = start_gen_pool(gen_workers) if gen_workers else None
     try:
         for table_name, ddl, indexes, insert_sql, gen_fn in TABLE_CONFIG:
             print(f"\n{'='*60}")
             print(f"  Processing table: {table_name}")
             print(f"{'='*60}")
 
-            ensure_table(conn, table_name, ddl, indexes)
-
+            ensure_table(conn, table_name, ddl)
+
+            # Bounded queue: at most `prefetch_batches` batches are generated ahead
+            # of the inserts (and at most that many are in flight in `gen_pool`)
+            batches = queue.Queue(maxsize=max(prefetch_batches, 1))
+            producer = threading.Thread(target=produce_batches, daemon=True,
+                                        args=(gen_fn, total_records, batch_size, batches,
+                                              gen_pool))
+            producer.start()
+
+            # One cursor per table: the INSERT is parsed once and every batch
+            # goes out as a single array-bound round trip. APPEND_VALUES makes it a
+            # direct-path load above the high-water mark, which must be committed
+            # before the next batch touches the table again.
+            input_sizes = lob_input_sizes(ddl, insert_sql)
             inserted = 0
-            for batch_start in range(0, total_records, batch_size):
-                batch_end = min(batch_start + batch_size, total_records)
-                batch = [gen_fn(i) for i in range(batch_start, batch_end)]
-                with conn.cursor() as cur:
-                    cur.executemany(insert_sql, batch)
-                conn.commit()
-                inserted += len(batch)
-                print(f"  [{table_name}] Inserted {inserted}/{total_records}")
-
+            with conn.cursor() as cur:
+                cur.execute(f"ALTER TABLE {table_name} NOLOGGING")
+                try:
+                    while (batch := batches.get()) is not None:
+                        if isinstance(batch, Exception):
+                            raise batch
+                        cur.setinputsizes(*input_sizes)
+                        cur.executemany(insert_sql, batch)
+                        conn.commit()
+                        inserted += len(batch)
+                        print(f"  [{table_name}] Inserted {inserted}/{total_records}")
+                except Exception:
+                    # Discard the uncommitted direct-path batch before the DDL below
+                    conn.rollback()
+                    raise
+                finally:
+                    # The table goes back to LOGGING even when the load fails
+                    cur.execute(f"ALTER TABLE {table_name} LOGGING")
+            producer.join()
+
+            create_indexes(conn, table_name, indexes)
             print(f"  Completed {table_name}: {inserted} records total.")
     finally:
+        if gen_pool is not None:
+            gen_pool.shutdown(cancel_futures=True)
         conn.close()
 
     print(f"\nAll tables populated successfully.")
@@ -654,7 +893,7 @@ def main():
         password=password,
         dsn=dsn,
         total_records=5000,
-        batch_size=500
+        batch_size=5000
     )
 
 if __name__ == "__main__":
@@ -11,15 +11,22 @@
 # =====================================================================================
 
 import psycopg
+from psycopg.adapt import Dumper
+from psycopg.pq import Format
 import random
 import string
 from decimal import Decimal
 from datetime import datetime, date, timedelta, time, timezone
 import uuid
 import json
+import os
+from itertools import combinations, permutations
 from typing import List, Dict, Any
 import sys
 import ipaddress
+import queue
+import threading
+from concurrent.futures import ProcessPoolExecutor
 
 # -------------------------------------------------------------------------------------
 # Shared helpers
@@ -31,11 +38,15 @@ PLANTS = ['US-PLANT-01', 'GER-PLANT-02', 'JP-PLANT-03', 'CN-PLANT-04', 'IN-PLANT
 TIMEZONES = ['UTC', 'US/Eastern', 'Europe/Berlin', 'Asia/Tokyo', 'Asia/Shanghai',
              'Asia/Kolkata', 'Australia/Sydney']
 
+def coin() -> bool:
+    # Single C-level draw for a 50/50 BOOLEAN column
+    return bool(random.getrandbits(1))
+
 def rand_str(length: int = 8) -> str:
     return ''.join(random.choices(string.ascii_letters + string.digits, k=length))
 
-def rand_ipv4() -> str:
-    return str(ipaddress.IPv4Address(random.randint(0x0A000001, 0x0AFFFFFF)))
+def rand_ipv4(_randint=random.randint) -> str:
+    return str(ipaddress.IPv4Address(_randint(0x0A000001, 0x0AFFFFFF)))
 
 def rand_ipv6() -> str:
     return str(ipaddress.IPv6Address(random.getrandbits(128)))
@@ -43,8 +54,12 @@ def rand_ipv6() -> str:
 def rand_mac() -> str:
     return ':'.join(f'{random.randint(0,255):02x}' for _ in range(6))
 
-def rand_semver() -> str:
-    return f"{random.randint(0,9)}.{random.randint(0,99)}.{random.randint(0,999)}"
+# Compact encoder built once: skips json.dumps' per-call option handling and
+# drops the padding spaces from every JSONB document
+dump_json = json.JSONEncoder(separators=(',', ':')).encode
+
+def rand_semver(_randint=random.randint) -> str:
+    return f"{_randint(0,9)}.{_randint(0,99)}.{_randint(0,999)}"
 
 
 # =====================================================================================
@@ -61,29 +76,15 @@ def ensure_table(conn, table_name: str, ddl: str):
     Args:
         conn (psycopg.Connection): The active PostgreSQL database connection object.
         table_name (str): The name of the table to check and create.
-        ddl (str): The SQL Data Definition Language (CREATE TABLE & INDEXES) statement.
+        ddl (str): The SQL Data Definition Language (CREATE TABLE) statement.
     """
     with conn.cursor() as cur:
-        # Check if table exists in the public schema. 
-        # Psycopg uses %s for safe parameter binding.
-        cur.execute("""
-            SELECT EXISTS (
-                SELECT FROM information_schema.tables 
-                WHERE table_schema = 'public' AND table_name = %s
-            )
-        """, (table_name,))
-        
-        exists = cur.fetchone()[0]
-        
-        # If the table is found, perform a clean teardown before rebuilding it.
-        if exists:
-            print(f"  Table {table_name} already exists. Dropping old table...")
-            # CASCADE drops the table even if other objects depend on it
-            cur.execute(f"DROP TABLE {table_name} CASCADE")
-            
-        # Execute the provided DDL string to create the table and its indexes from scratch
-        print(f"  Creating table {table_name}...")
-        cur.execute(ddl)
+        # Drop any previous table and create the new one in a single round trip.
+        # IF EXISTS makes the drop a no-op on a fresh database, so no existence
+        # query is needed; CASCADE drops the table even if other objects depend on it.
+        # Psycopg accepts several statements in one execute when no parameters are bound.
+        print(f"  Recreating table {table_name}...")
+        cur.execute(f"DROP TABLE IF EXISTS {table_name} CASCADE;\n{ddl}")
         
         # Commit the transaction so the drop/create operations are saved
         conn.commit()
@@ -95,7 +96,7 @@ def ensure_table(conn, table_name: str, ddl: str):
 INVOICES_DDL = """
 CREATE TABLE IF NOT EXISTS invoices (
     invoice_id          SERIAL PRIMARY KEY,
-    invoice_number      VARCHAR(50) UNIQUE NOT NULL,
+    invoice_number      VARCHAR(50) NOT NULL,           -- UNIQUE added after load
     customer_id         INTEGER NOT NULL,
     customer_code       VARCHAR(20) NOT NULL,
     customer_name       VARCHAR(255) NOT NULL,
@@ -149,13 +150,19 @@ CREATE TABLE IF NOT EXISTS invoices (
     CONSTRAINT chk_inv_tax_positive      CHECK (tax_amount >= 0),
     CONSTRAINT chk_inv_discount_positive CHECK (discount_amount >= 0)
 );
-CREATE INDEX IF NOT EXISTS idx_inv_number    ON invoices(invoice_number);
-CREATE INDEX IF NOT EXISTS idx_inv_cust_code ON invoices(customer_code);
-CREATE INDEX IF NOT EXISTS idx_inv_date      ON invoices(invoice_date);
-CREATE INDEX IF NOT EXISTS idx_inv_paid      ON invoices(is_paid);
-CREATE INDEX IF NOT EXISTS idx_inv_status    ON invoices(status);
 """
 
+# Secondary indexes and UNIQUE keys are created after the load: one sorted build
+# per index instead of B-tree maintenance on every inserted row. A UNIQUE
+# constraint brings its own index, so its column gets no separate one.
+INVOICES_IDX = [
+    "ALTER TABLE invoices ADD CONSTRAINT uq_inv_number UNIQUE (invoice_number)",
+    "CREATE INDEX IF NOT EXISTS idx_inv_cust_code ON invoices(customer_code)",
+    "CREATE INDEX IF NOT EXISTS idx_inv_date      ON invoices(invoice_date)",
+    "CREATE INDEX IF NOT EXISTS idx_inv_paid      ON invoices(is_paid)",
+    "CREATE INDEX IF NOT EXISTS idx_inv_status    ON invoices(status)",
+]
+
 INVOICES_INSERT = """
 INSERT INTO invoices (
     invoice_number, customer_id, customer_code, customer_name, customer_address,
@@ -172,68 +179,82 @@ INSERT INTO invoices (
 )
 """
 
-def gen_invoice(idx: int) -> tuple:
-    billing = random.choice(COUNTRIES)
-    shipping = random.choice(COUNTRIES)
-    currency = random.choice(CURRENCIES)
-    items_count = random.randint(1, 15)
-    items, subtotal = [], Decimal('0.00')
+# Row-invariant values, built once instead of on every gen_invoice call
+UOMS = ['PCS','KG','M','L']
+PAYMENT_TERMS = ['NET30','NET60','DUE_ON_RECEIPT','NET15']
+INVOICE_STATUSES = ['DRAFT','SENT','PAID','OVERDUE','CANCELLED']
+# Code strings from small fixed ranges, formatted once instead of per row
+SALES_REPS = [f"SalesRep-{i}" for i in range(1, 51)]
+CUSTOMER_NAMES = [f"Customer {i} Corp." for i in range(1, 1001)]
+PRODUCT_CODES = [f"PROD-{i}" for i in range(1000, 10000)]
+PART_DESCRIPTIONS = [f"Manufactured Part {i}" for i in range(100, 1000)]
+PROJECT_CODES = [f"PROJ-{i}" for i in range(1000, 10000)]
+COST_CENTERS = [f"CC-{i}" for i in range(100, 1000)]
+
+def gen_invoice(idx: int, now: datetime, _choice=random.choice, _randint=random.randint,
+                _uniform=random.uniform) -> tuple:
+    billing = _choice(COUNTRIES)
+    shipping = _choice(COUNTRIES)
+    currency = _choice(CURRENCIES)
+    items_count = _randint(1, 15)
+    # Money is kept in integer cents: exact like Decimal, but plain int arithmetic.
+    # Amounts are converted once to floats with at most two decimals, which the
+    # DECIMAL columns store exactly.
+    items, subtotal = [], 0
     for j in range(items_count):
-        up = Decimal(str(round(random.uniform(10, 1000), 2)))
-        qty = random.randint(1, 50)
+        up = _randint(1000, 100000)
+        qty = _randint(1, 50)
         total = up * qty
         items.append({
             'item_id': j + 1,
-            'product_code': f"PROD-{random.randint(1000,9999)}",
-            'description': f'Manufactured Part {random.randint(100,999)}',
+            'product_code': _choice(PRODUCT_CODES),
+            'description': _choice(PART_DESCRIPTIONS),
             'quantity': qty,
-            'unit_price': float(up),
-            'total_amount': float(total),
-            'uom': random.choice(['PCS','KG','M','L']),
-            'hs_code': f"{random.randint(1000,9999)}.{random.randint(10,99)}"
+            'unit_price': up / 100,
+            'total_amount': total / 100,
+            'uom': _choice(UOMS),
+            'hs_code': f"{_randint(1000,9999)}.{_randint(10,99)}"
         })
         subtotal += total
 
-    discount = Decimal(str(round(random.uniform(0, min(float(subtotal * Decimal('0.2')), 500)), 2)))
-    ship_cost = Decimal(str(round(random.uniform(0, 200), 2)))
-    tax_rate = round(random.uniform(0.05, 0.25), 3)
-    tax_amt = (subtotal - discount) * Decimal(str(tax_rate))
+    discount = _randint(0, min(subtotal // 5, 50000))
+    ship_cost = _randint(0, 20000)
+    tax_rate = round(_uniform(0.05, 0.25), 3)
+    tax_amt = round((subtotal - discount) * tax_rate)
     total_amt = subtotal - discount + tax_amt + ship_cost
 
-    base_dt = date.today() - timedelta(days=random.randint(0, 365))
-    created = datetime.now(timezone.utc) - timedelta(days=random.randint(0, 30))
-    pay_dt = created - timedelta(days=random.randint(1, 15)) if random.random() > 0.5 else None
-    ship_dt = created - timedelta(days=random.randint(1, 10)) if random.random() > 0.5 else None
-    appr_dt = created - timedelta(days=random.randint(1, 5)) if random.random() > 0.5 else None
+    base_dt = now.date() - timedelta(days=_randint(0, 365))
+    created = now - timedelta(days=_randint(0, 30))
+    pay_dt = created - timedelta(days=_randint(1, 15)) if coin() else None
+    ship_dt = created - timedelta(days=_randint(1, 10)) if coin() else None
+    appr_dt = created - timedelta(days=_randint(1, 5)) if coin() else None
 
     return (
-        f"INV-{date.today().strftime('%Y%m')}-{idx+1:06d}",
-        random.randint(1000, 9999),
-        f"CUST-{random.randint(10000,99999)}",
-        f"Customer {random.randint(1,1000)} Corp.",
-        f"{random.randint(1,9999)} Main St, City {random.randint(1,100)}, {billing}",
+        f"INV-{now:%Y%m}-{idx+1:06d}",
+        _randint(1000, 9999),
+        f"CUST-{_randint(10000,99999)}",
+        _choice(CUSTOMER_NAMES),
+        f"{_randint(1,9999)} Main St, City {_randint(1,100)}, {billing}",
         billing, shipping, currency,
-        random.choice(['NET30','NET60','DUE_ON_RECEIPT','NET15']),
-        f"SalesRep-{random.randint(1,50)}",
-        total_amt, tax_amt, discount, ship_cost, subtotal,
-        items_count, random.randint(0, 5), random.randint(1, 10),
-        round(random.uniform(0.8, 1.2), 4), tax_rate,
-        random.choice([True, False]), random.choice([True, False]),
-        random.choice([True, False]), random.choice([True, False]),
+        _choice(PAYMENT_TERMS),
+        _choice(SALES_REPS),
+        total_amt / 100, tax_amt / 100, discount / 100, ship_cost / 100, subtotal / 100,
+        items_count, _randint(0, 5), _randint(1, 10),
+        round(_uniform(0.8, 1.2), 4), tax_rate,
+        coin(), coin(), coin(), coin(),
         billing != shipping,
-        base_dt, base_dt + timedelta(days=random.randint(15, 90)),
+        base_dt, base_dt + timedelta(days=_randint(15, 90)),
         created, pay_dt, ship_dt, appr_dt,
-        random.choice(TIMEZONES),
-        json.dumps(items),
-        bytes(random.getrandbits(8) for _ in range(64)),
-        json.dumps({'version': '1.0', 'batch_id': str(uuid.uuid4()),
-                    'quality_metrics': {'score': round(random.uniform(85, 99.9), 1)}}),
-        random.choice(['DRAFT','SENT','PAID','OVERDUE','CANCELLED']),
-        f"PROJ-{random.randint(1000,9999)}",
-        f"CC-{random.randint(100,999)}",
-        random.choice(PLANTS),
-        random.choice([True, False]),
-        random.choice([True, False])
+        _choice(TIMEZONES),
+        dump_json(items),
+        os.urandom(64),
+        dump_json({'version': '1.0', 'batch_id': str(uuid.uuid4()),
+                    'quality_metrics': {'score': round(_uniform(85, 99.9), 1)}}),
+        _choice(INVOICE_STATUSES),
+        _choice(PROJECT_CODES),
+        _choice(COST_CENTERS),
+        _choice(PLANTS),
+        coin(), coin()
     )
 
 
@@ -244,7 +265,7 @@ EMPLOYEES_DDL = """
 CREATE TABLE IF NOT EXISTS employees (
     employee_id         SERIAL PRIMARY KEY,
     employee_uuid       UUID NOT NULL DEFAULT gen_random_uuid(),
-    employee_code       VARCHAR(20) UNIQUE NOT NULL,
+    employee_code       VARCHAR(20) NOT NULL,           -- UNIQUE added after load
     first_name          VARCHAR(100) NOT NULL,
     last_name           VARCHAR(100) NOT NULL,
     full_name           TEXT GENERATED ALWAYS AS (first_name || ' ' || last_name) STORED,
@@ -307,15 +328,18 @@ CREATE TABLE IF NOT EXISTS employees (
     CONSTRAINT chk_emp_type   CHECK (employment_type IN ('Full-Time','Part-Time','Contract','Intern')),
     CONSTRAINT chk_emp_salary CHECK (base_salary >= 0)
 );
-CREATE INDEX IF NOT EXISTS idx_emp_uuid   ON employees(employee_uuid);
-CREATE INDEX IF NOT EXISTS idx_emp_code   ON employees(employee_code);
-CREATE INDEX IF NOT EXISTS idx_emp_dept   ON employees(department);
-CREATE INDEX IF NOT EXISTS idx_emp_active ON employees(is_active);
 """
 
+EMPLOYEES_IDX = [
+    "CREATE INDEX IF NOT EXISTS idx_emp_uuid   ON employees(employee_uuid)",
+    "ALTER TABLE employees ADD CONSTRAINT uq_emp_code UNIQUE (employee_code)",
+    "CREATE INDEX IF NOT EXISTS idx_emp_dept   ON employees(department)",
+    "CREATE INDEX IF NOT EXISTS idx_emp_active ON employees(is_active)",
+]
+
 EMPLOYEES_INSERT = """
 INSERT INTO employees (
-    employee_uuid, employee_code, first_name, last_name, email, phone_number,
+    employee_code, first_name, last_name, email, phone_number,
     gender, employment_type, department, job_title, job_level,
     base_salary, bonus_pct, stock_options, years_experience, employee_rating, badge_number,
     is_active, is_manager, has_remote_access, background_check_ok,
@@ -327,7 +351,7 @@ INSERT INTO employees (
     profile_photo_thumb, bio, notes
 ) VALUES (
     %s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,
-    %s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s
+    %s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s
 )
 """
 
@@ -342,69 +366,99 @@ SKILLS_POOL = ['Python','Java','SQL','AWS','Docker','Kubernetes','React','TypeSc
                'Terraform','CI/CD','Machine Learning','Data Engineering','Kafka','Spark']
 CERTS_POOL = ['AWS-SAA','AWS-SAP','CKA','PMP','CISSP','TOGAF','AZ-900','GCP-ACE','CKAD','OCP']
 
-def gen_employee(idx: int) -> tuple:
-    fn = random.choice(FIRST_NAMES)
-    ln = random.choice(LAST_NAMES)
-    emp_uuid = str(uuid.uuid4())
-    dob = date(random.randint(1960, 2002), random.randint(1, 12), random.randint(1, 28))
-    hire = date(random.randint(2010, 2025), random.randint(1, 12), random.randint(1, 28))
-    term = hire + timedelta(days=random.randint(180, 1800)) if random.random() < 0.15 else None
+def subset_table(pool: List[str], k_min: int, k_max: int) -> Dict[int, List[List[str]]]:
+    """
+    Enumerates every k-element subset of a small pool, grouped by k.
+
+    Drawing k uniformly and then one subset of that size uniformly gives the same
+    distribution as random.sample(pool, k), with two C-level calls per row instead
+    of a Python-level sampling loop. The pools are small enough that the tables
+    fit in a few MB.
+
+    Args:
+        pool (List[str]): The values to draw from.
+        k_min (int): Smallest subset size.
+        k_max (int): Largest subset size.
 
-    skills = random.sample(SKILLS_POOL, k=random.randint(2, 7))
-    certs = random.sample(CERTS_POOL, k=random.randint(0, 4))
-    proj_ids = [random.randint(1000, 9999) for _ in range(random.randint(1, 5))]
+    Returns:
+        Dict[int, List[List[str]]]: All subsets of each size, in pool order.
+    """
+    return {k: [list(c) for c in combinations(pool, k)] for k in range(k_min, k_max + 1)}
+
+SKILL_SETS = subset_table(SKILLS_POOL, 2, 7)
+CERT_SETS = subset_table(CERTS_POOL, 0, 4)
+
+# Choice pools are module constants so rows don't rebuild list literals per call
+GENDERS = ['Male','Female','Non-Binary','Prefer Not to Say']
+EMPLOYMENT_TYPES = ['Full-Time','Part-Time','Contract','Intern']
+BACKGROUND_CHECK_STATES = [True, False, None]
+PROBATION_PERIODS = ['3 months','6 months']
+STREET_NAMES = ['Oak','Elm','Main','Maple']
+ADDRESS_CITIES = ['Tokyo','Berlin','Mumbai','NYC','London','Singapore']
+RELATIONS = ['Spouse','Parent','Sibling','Friend']
+THEMES = ['dark','light','system']
+LANGUAGES = ['en','de','ja','hi','es']
+
+def gen_employee(idx: int, now: datetime, _choice=random.choice, _randint=random.randint,
+                 _uniform=random.uniform, _random=random.random) -> tuple:
+    fn = _choice(FIRST_NAMES)
+    ln = _choice(LAST_NAMES)
+    dob = date(_randint(1960, 2002), _randint(1, 12), _randint(1, 28))
+    hire = date(_randint(2010, 2025), _randint(1, 12), _randint(1, 28))
+    term = hire + timedelta(days=_randint(180, 1800)) if _random() < 0.15 else None
+
+    skills = _choice(SKILL_SETS[_randint(2, 7)])
+    certs = _choice(CERT_SETS[_randint(0, 4)])
+    proj_ids = [_randint(1000, 9999) for _ in range(_randint(1, 5))]
 
     return (
-        emp_uuid,
         f"EMP-{idx+1:06d}",
         fn, ln,
-        f"{fn.lower()}.{ln.lower()}{random.randint(1,99)}@example.com",
-        f"+{random.randint(1,99)}-{random.randint(100,999)}-{random.randint(1000,9999)}",
-        random.choice(['Male','Female','Non-Binary','Prefer Not to Say']),
-        random.choice(['Full-Time','Part-Time','Contract','Intern']),
-        random.choice(DEPARTMENTS),
-        random.choice(JOB_TITLES),
-        random.randint(1, 10),
-        Decimal(str(round(random.uniform(30000, 250000), 2))),
-        round(random.uniform(0, 0.30), 4),           # REAL / float32
-        random.randint(0, 50000),
-        random.randint(0, 35),
-        round(random.uniform(1.0, 5.0), 6),          # DOUBLE
-        random.randint(100000, 999999),               # BIGINT
-        random.choice([True, False]),
-        random.choice([True, False]),
-        random.choice([True, False]),
-        random.choice([True, False, None]),
+        f"{fn.lower()}.{ln.lower()}{_randint(1,99)}@example.com",
+        f"+{_randint(1,99)}-{_randint(100,999)}-{_randint(1000,9999)}",
+        _choice(GENDERS),
+        _choice(EMPLOYMENT_TYPES),
+        _choice(DEPARTMENTS),
+        _choice(JOB_TITLES),
+        _randint(1, 10),
+        round(_uniform(30000, 250000), 2),
+        round(_uniform(0, 0.30), 4),           # REAL / float32
+        _randint(0, 50000),
+        _randint(0, 35),
+        round(_uniform(1.0, 5.0), 6),          # DOUBLE
+        _randint(100000, 999999),               # BIGINT
+        coin(), coin(), coin(),
+        _choice(BACKGROUND_CHECK_STATES),
         dob, hire, term,
-        time(random.randint(0, 23), random.randint(0, 59), random.randint(0, 59)),
-        time(random.randint(6, 10), 0, 0),
-        datetime.now(timezone.utc) - timedelta(days=random.randint(0, 30)),
-        datetime.now() - timedelta(days=random.randint(0, 10)),
-        f"{random.choice([3,6])} months",             # INTERVAL
+        time(_randint(0, 23), _randint(0, 59), _randint(0, 59)),
+        time(_randint(6, 10), 0, 0),
+        now - timedelta(days=_randint(0, 30)),
+        now.replace(tzinfo=None) - timedelta(days=_randint(0, 10)),
+        _choice(PROBATION_PERIODS),             # INTERVAL
         rand_ipv4(),
         rand_mac(),
         skills,          # TEXT[]
         certs,           # VARCHAR[]
         proj_ids,        # INTEGER[]
-        json.dumps({
-            'street': f"{random.randint(1,9999)} {random.choice(['Oak','Elm','Main','Maple'])} St",
-            'city': random.choice(['Tokyo','Berlin','Mumbai','NYC','London','Singapore']),
-            'zip': f"{random.randint(10000,99999)}",
-            'country': random.choice(COUNTRIES)
+        dump_json({
+            'street': f"{_randint(1,9999)} {_choice(STREET_NAMES)} St",
+            'city': _choice(ADDRESS_CITIES),
+            'zip': f"{_randint(10000,99999)}",
+            'country': _choice(COUNTRIES)
         }),
-        json.dumps({
-            'name': f"{random.choice(FIRST_NAMES)} {random.choice(LAST_NAMES)}",
-            'phone': f"+{random.randint(1,99)}-{random.randint(100,999)}-{random.randint(1000,9999)}",
-            'relation': random.choice(['Spouse','Parent','Sibling','Friend'])
+        dump_json({
+            'name': f"{_choice(FIRST_NAMES)} {_choice(LAST_NAMES)}",
+            'phone': f"+{_randint(1,99)}-{_randint(100,999)}-{_randint(1000,9999)}",
+            'relation': _choice(RELATIONS)
         }),
-        json.dumps({
-            'theme': random.choice(['dark','light','system']),
-            'notifications': random.choice([True, False]),
-            'language': random.choice(['en','de','ja','hi','es'])
+        dump_json({
+            'theme': _choice(THEMES),
+            'notifications': coin(),
+            'language': _choice(LANGUAGES)
         }),
-        bytes(random.getrandbits(8) for _ in range(128)),  # small thumbnail stub
-        f"Experienced {random.choice(JOB_TITLES).lower()} with {random.randint(1,20)} years in {random.choice(DEPARTMENTS).lower()}.",
-        f"Note: {rand_str(50)}" if random.random() > 0.5 else None
+        os.urandom(128),  # small thumbnail stub
+        f"Experienced {_choice(JOB_TITLES).lower()} with {_randint(1,20)} years in {_choice(DEPARTMENTS).lower()}.",
+        f"Note: {rand_str(50)}" if coin() else None
     )
 
 
@@ -460,15 +514,18 @@ CREATE TABLE IF NOT EXISTS sensor_readings (
     location_name       VARCHAR(200),
     notes               TEXT
 );
-CREATE INDEX IF NOT EXISTS idx_sr_device    ON sensor_readings(device_id);
-CREATE INDEX IF NOT EXISTS idx_sr_ts        ON sensor_readings(reading_timestamp);
-CREATE INDEX IF NOT EXISTS idx_sr_date      ON sensor_readings(reading_date);
-CREATE INDEX IF NOT EXISTS idx_sr_anomaly   ON sensor_readings(is_anomaly);
 """
 
+SENSOR_IDX = [
+    "CREATE INDEX IF NOT EXISTS idx_sr_device    ON sensor_readings(device_id)",
+    "CREATE INDEX IF NOT EXISTS idx_sr_ts        ON sensor_readings(reading_timestamp)",
+    "CREATE INDEX IF NOT EXISTS idx_sr_date      ON sensor_readings(reading_date)",
+    "CREATE INDEX IF NOT EXISTS idx_sr_anomaly   ON sensor_readings(is_anomaly)",
+]
+
 SENSOR_INSERT = """
 INSERT INTO sensor_readings (
-    reading_uuid, device_id, device_serial, firmware_version,
+    device_id, device_serial, firmware_version,
     temperature_c, humidity_pct, pressure_hpa, voltage, current_amps, power_watts,
     latitude, longitude, altitude_m, signal_strength_dbm, error_code, uptime_seconds,
     is_anomaly, is_calibrated, battery_low,
@@ -478,64 +535,73 @@ INSERT INTO sensor_readings (
     raw_payload, location_name, notes
 ) VALUES (
     %s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,
-    %s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s
+    %s,%s,%s,%s,%s,%s,%s,%s,%s,%s
 )
 """
 
 SENSOR_LOCATIONS = ['Factory Floor A','Warehouse B','Server Room C','Outdoor Station D',
                     'Cold Storage E','Lab Room F','Rooftop G','Basement H']
-
-def gen_sensor_reading(idx: int) -> tuple:
-    ts = datetime.now(timezone.utc) - timedelta(
-        days=random.randint(0, 90),
-        hours=random.randint(0, 23),
-        minutes=random.randint(0, 59),
-        seconds=random.randint(0, 59)
-    )
-    lat = Decimal(str(round(random.uniform(-90, 90), 7)))
-    lon = Decimal(str(round(random.uniform(-180, 180), 7)))
-
-    raw_samples = [round(random.uniform(-50, 150), 6) for _ in range(random.randint(5, 20))]
+TAG_IDS = range(1, 501)
+READING_WINDOW_SECONDS = 91 * 86400                 # readings span the last ~90 days
+DEVICE_IDS = [f"DEV-{i:04d}" for i in range(1, 201)]
+SENSOR_ERROR_CODES = [0, 0, 0, 0, 1, 2, 3, 99]                 # mostly 0
+SENSOR_LABELS = ['temp','humidity','pressure','vibration','acoustic','light']
+SENSOR_MANUFACTURERS = ['Bosch','Siemens','Honeywell','ABB']
+NOTIFY_CHANNELS = ['email','sms','slack']
+RECEIVE_LAGS = [timedelta(milliseconds=ms) for ms in range(50, 2001)]
+
+def gen_sensor_reading(idx: int, now: datetime, _choice=random.choice, _randint=random.randint,
+                       _uniform=random.uniform, _random=random.random,
+                       _sample=random.sample, _choices=random.choices,
+                       _randrange=random.randrange) -> tuple:
+    # One draw over the whole window is equivalent to separate day/hour/minute/second draws
+    ts = now - timedelta(seconds=_randrange(READING_WINDOW_SECONDS))
+    # DECIMAL columns are exact Decimals built from scaled integers (binary COPY
+    # only dumps Decimal/int to NUMERIC); scaleb avoids a str round trip
+    lat = Decimal(_randint(-900_000_000, 900_000_000)).scaleb(-7)
+    lon = Decimal(_randint(-1_800_000_000, 1_800_000_000)).scaleb(-7)
+
+    # random() scaled inline: uniform() is a Python-level call per sample
+    raw_samples = [round(-50 + 200 * _random(), 6) for _ in range(_randint(5, 20))]
 
     return (
-        str(uuid.uuid4()),
-        f"DEV-{random.randint(1,200):04d}",
+        _choice(DEVICE_IDS),
         rand_str(16).upper(),
         rand_semver(),
-        Decimal(str(round(random.uniform(-40, 85), 4))),
-        Decimal(str(round(random.uniform(0, 100), 3))),
-        Decimal(str(round(random.uniform(900, 1100), 4))),
-        round(random.uniform(0, 48), 3),               # REAL
-        round(random.uniform(0, 10), 8),                # DOUBLE
-        Decimal(str(round(random.uniform(0, 5000), 6))),
+        Decimal(_randint(-400_000, 850_000)).scaleb(-4),
+        Decimal(_randint(0, 100_000)).scaleb(-3),
+        Decimal(_randint(9_000_000, 11_000_000)).scaleb(-4),
+        round(_uniform(0, 48), 3),               # REAL
+        round(_uniform(0, 10), 8),                # DOUBLE
+        Decimal(_randint(0, 5_000_000_000)).scaleb(-6),
         lat, lon,
-        round(random.uniform(-50, 5000), 2),            # altitude REAL
-        random.randint(-120, 0),                         # SMALLINT
-        random.choice([0, 0, 0, 0, 1, 2, 3, 99]),       # mostly 0
-        random.randint(0, 10_000_000),                   # BIGINT
-        random.random() < 0.05,                          # 5% anomaly rate
-        random.random() > 0.02,
-        random.random() < 0.1,
+        round(_uniform(-50, 5000), 2),            # altitude REAL
+        _randint(-120, 0),                         # SMALLINT
+        _choice(SENSOR_ERROR_CODES),
+        _randint(0, 10_000_000),                   # BIGINT
+        _random() < 0.05,                          # 5% anomaly rate
+        _random() > 0.02,
+        _random() < 0.1,
         ts,
-        ts + timedelta(milliseconds=random.randint(50, 2000)),
+        ts + _choice(RECEIVE_LAGS),
         ts.date(),
         ts.time(),
-        [random.randint(1, 500) for _ in range(random.randint(1, 5))],
-        random.sample(['temp','humidity','pressure','vibration','acoustic','light'], k=random.randint(1,4)),
+        _choices(TAG_IDS, k=_randint(1, 5)),
+        _sample(SENSOR_LABELS, k=_randint(1,4)),
         raw_samples,
-        json.dumps({
-            'manufacturer': random.choice(['Bosch','Siemens','Honeywell','ABB']),
-            'model': f"M{random.randint(100,999)}",
-            'install_date': str(date.today() - timedelta(days=random.randint(30, 1000)))
+        dump_json({
+            'manufacturer': _choice(SENSOR_MANUFACTURERS),
+            'model': f"M{_randint(100,999)}",
+            'install_date': str(now.date() - timedelta(days=_randint(30, 1000)))
         }),
-        json.dumps({
-            'temp_high': round(random.uniform(50, 80), 1),
-            'temp_low': round(random.uniform(-20, 10), 1),
-            'notify': random.choice(['email','sms','slack'])
+        dump_json({
+            'temp_high': round(_uniform(50, 80), 1),
+            'temp_low': round(_uniform(-20, 10), 1),
+            'notify': _choice(NOTIFY_CHANNELS)
         }),
-        bytes(random.getrandbits(8) for _ in range(random.randint(32, 256))),
-        random.choice(SENSOR_LOCATIONS),
-        f"Auto-generated reading #{idx+1}" if random.random() > 0.7 else None
+        os.urandom(_randint(32, 256)),
+        _choice(SENSOR_LOCATIONS),
+        f"Auto-generated reading #{idx+1}" if _random() > 0.7 else None
     )
 
 
@@ -546,7 +612,7 @@ CATALOG_DDL = """
 CREATE TABLE IF NOT EXISTS product_catalog (
     product_id          SERIAL PRIMARY KEY,
     product_uuid        UUID NOT NULL DEFAULT gen_random_uuid(),
-    sku                 VARCHAR(40) UNIQUE NOT NULL,
+    sku                 VARCHAR(40) NOT NULL,           -- UNIQUE added after load
     product_name        VARCHAR(300) NOT NULL,
     category            VARCHAR(100) NOT NULL,
     subcategory         VARCHAR(100),
@@ -609,15 +675,18 @@ CREATE TABLE IF NOT EXISTS product_catalog (
     CONSTRAINT chk_cat_price CHECK (unit_price >= 0),
     CONSTRAINT chk_cat_stock CHECK (stock_quantity >= 0)
 );
-CREATE INDEX IF NOT EXISTS idx_cat_sku      ON product_catalog(sku);
-CREATE INDEX IF NOT EXISTS idx_cat_category ON product_catalog(category);
-CREATE INDEX IF NOT EXISTS idx_cat_brand    ON product_catalog(brand);
-CREATE INDEX IF NOT EXISTS idx_cat_active   ON product_catalog(is_active);
 """
 
+CATALOG_IDX = [
+    "ALTER TABLE product_catalog ADD CONSTRAINT uq_cat_sku UNIQUE (sku)",
+    "CREATE INDEX IF NOT EXISTS idx_cat_category ON product_catalog(category)",
+    "CREATE INDEX IF NOT EXISTS idx_cat_brand    ON product_catalog(brand)",
+    "CREATE INDEX IF NOT EXISTS idx_cat_active   ON product_catalog(is_active)",
+]
+
 CATALOG_INSERT = """
 INSERT INTO product_catalog (
-    product_uuid, sku, product_name, category, subcategory, brand,
+    sku, product_name, category, subcategory, brand,
     description_short, description_long,
     unit_price, wholesale_price, cost_price,
     weight_kg, length_cm, width_cm, height_cm, volume_cm3,
@@ -631,7 +700,7 @@ INSERT INTO product_catalog (
 ) VALUES (
     %s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,
     %s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,
-    %s,%s,%s,%s,%s,%s
+    %s,%s,%s,%s,%s
 )
 """
 
@@ -644,114 +713,392 @@ CATEGORIES = {
 }
 BRANDS = ['Bosch','3M','Siemens','ABB','Schneider','Honeywell','TE Connectivity','Parker']
 COLORS = ['Red','Blue','Green','Black','White','Silver','Yellow','Orange','Gray']
-
-def gen_product(idx: int) -> tuple:
-    cat = random.choice(list(CATEGORIES.keys()))
-    subcat = random.choice(CATEGORIES[cat])
-    brand = random.choice(BRANDS)
-    unit_p = Decimal(str(round(random.uniform(1, 5000), 4)))
-    ws_p = unit_p * Decimal(str(round(random.uniform(0.5, 0.9), 2)))
-    cost_p = ws_p * Decimal(str(round(random.uniform(0.4, 0.8), 2)))
-    w = round(random.uniform(0.01, 100), 3)
-    l = round(random.uniform(1, 200), 2)
-    wd = round(random.uniform(1, 200), 2)
-    h = round(random.uniform(1, 200), 2)
-
-    launch = date(random.randint(2015, 2025), random.randint(1, 12), random.randint(1, 28))
-    disc = launch + timedelta(days=random.randint(365, 3650)) if random.random() < 0.1 else None
-    restock = date.today() - timedelta(days=random.randint(0, 90))
+# Every category has the same number of subcategories, so one pick from the flat
+# pair list has the same distribution as a category pick followed by a subcategory pick
+CATEGORY_PAIRS = [(cat, subcat) for cat, subcats in CATEGORIES.items() for subcat in subcats]
+CATEGORY_PREFIXES = {cat: cat[:3].upper() for cat in CATEGORIES}
+# Every SKU a compatible_skus entry can name (~50k strings), so each entry is one choice()
+COMPATIBLE_SKUS = [f"SKU-{prefix}-{n:06d}" for prefix in CATEGORY_PREFIXES.values()
+                   for n in range(1, 10000)]
+PRODUCT_LINES = ['Pro','Standard','Elite','Eco','Max']
+ACTIVE_STATES = [True, True, True, False]
+PRODUCT_TAGS = ['industrial','premium','sale','new','eco','certified','OEM']
+MATERIALS = ['Steel','Aluminum','Plastic','Composite','Copper']
+IP_RATINGS = ['IP54','IP65','IP67','IP68']
+PRODUCT_CERTS = ['CE','UL','ISO9001','RoHS','REACH']
+SHIP_CLASSES = ['Standard','Oversize','Hazmat','Fragile']
+SEO_KEYWORDS = ['industrial','tools','safety','electronics','parts']
+INTERNAL_NOTES = [f"Internal: margin tier {tier}, review pending" for tier in 'ABC']
+# Every launch date the year/month/day(1-28) draw can produce, and the day offsets
+# used for restock/created dates: one choice() replaces several randint() calls
+# and a date/timedelta construction per row
+LAUNCH_DATES = [date(y, m, d) for y in range(2015, 2026) for m in range(1, 13) for d in range(1, 29)]
+RESTOCK_AGES = [timedelta(days=d) for d in range(0, 91)]
+CREATED_AGES = [timedelta(days=d) for d in range(0, 61)]
+# JSON-encoded pool values for the fixed-shape catalog documents, which are filled
+# in as string templates instead of building and encoding a dict per row
+MATERIALS_JSON = [dump_json(m) for m in MATERIALS]
+IP_RATINGS_JSON = [dump_json(r) for r in IP_RATINGS]
+SHIP_CLASSES_JSON = [dump_json(c) for c in SHIP_CLASSES]
+COUNTRIES_JSON = [dump_json(c) for c in COUNTRIES]
+SEO_KEYWORD_LISTS = [dump_json(list(p)) for p in permutations(SEO_KEYWORDS, 3)]
+SEO_TEXTS = {(subcat, brand): (dump_json(f"Buy {subcat} from {brand}"),
+                               dump_json(f"Shop {brand} {subcat} at competitive prices."))
+             for _, subcat in CATEGORY_PAIRS for brand in BRANDS}
+
+def gen_product(idx: int, now: datetime, _choice=random.choice, _randint=random.randint,
+                _uniform=random.uniform, _random=random.random,
+                _sample=random.sample) -> tuple:
+    cat, subcat = _choice(CATEGORY_PAIRS)
+    brand = _choice(BRANDS)
+    # Prices in 1/10000 units and the wholesale/cost ratios in percent, all integers;
+    # the DECIMAL(12,4) columns round the wider-scale products on input
+    unit_units = _randint(10_000, 50_000_000)
+    ws_units = unit_units * _randint(50, 90)
+    cost_units = ws_units * _randint(40, 80)
+    unit_p = Decimal(unit_units).scaleb(-4)
+    ws_p = Decimal(ws_units).scaleb(-6)
+    cost_p = Decimal(cost_units).scaleb(-8)
+    w = round(_uniform(0.01, 100), 3)
+    l = round(_uniform(1, 200), 2)
+    wd = round(_uniform(1, 200), 2)
+    h = round(_uniform(1, 200), 2)
+
+    launch = _choice(LAUNCH_DATES)
+    disc = launch + timedelta(days=_randint(365, 3650)) if _random() < 0.1 else None
+    restock = now.date() - _choice(RESTOCK_AGES)
+    seo_title, seo_description = SEO_TEXTS[subcat, brand]
 
     return (
-        str(uuid.uuid4()),
-        f"SKU-{cat[:3].upper()}-{idx+1:06d}",
-        f"{brand} {subcat} {random.choice(['Pro','Standard','Elite','Eco','Max'])} {random.randint(100,999)}",
+        f"SKU-{CATEGORY_PREFIXES[cat]}-{idx+1:06d}",
+        f"{brand} {subcat} {_choice(PRODUCT_LINES)} {_randint(100,999)}",
         cat, subcat, brand,
-        f"High-quality {subcat.lower()} for industrial use. Model #{random.randint(100,999)}.",
-        f"Detailed description for {subcat} product by {brand}. " * random.randint(3, 10),
+        f"High-quality {subcat.lower()} for industrial use. Model #{_randint(100,999)}.",
+        f"Detailed description for {subcat} product by {brand}. " * _randint(3, 10),
         unit_p, ws_p, cost_p,
         w, l, wd, h, round(l * wd * h, 4),
-        random.randint(0, 10000), random.randint(5, 100), random.randint(50, 5000),
-        round(random.uniform(0, 100), 8),
-        Decimal(str(round(random.uniform(1, 5), 2))),
-        random.randint(0, 5000),
-        random.randint(0, 1_000_000),
-        random.choice([True, True, True, False]),
-        random.random() < 0.1,
-        random.random() < 0.2,
+        _randint(0, 10000), _randint(5, 100), _randint(50, 5000),
+        round(_uniform(0, 100), 8),
+        Decimal(_randint(100, 500)).scaleb(-2),
+        _randint(0, 5000),
+        _randint(0, 1_000_000),
+        _choice(ACTIVE_STATES),
+        _random() < 0.1,
+        _random() < 0.2,
         cat == 'Chemicals',
-        random.random() < 0.3,
-        random.random() < 0.05,
+        _random() < 0.3,
+        _random() < 0.05,
         launch, disc, restock,
-        datetime.now(timezone.utc) - timedelta(days=random.randint(0, 60)),
-        datetime.now(),
-        random.sample(['industrial','premium','sale','new','eco','certified','OEM'], k=random.randint(1, 4)),
-        random.sample(COLORS, k=random.randint(1, 4)),
-        [f"SKU-{random.choice(list(CATEGORIES.keys()))[:3].upper()}-{random.randint(1,9999):06d}"
-         for _ in range(random.randint(0, 3))],
-        [random.randint(1, 20) for _ in range(random.randint(1, 4))],
-        json.dumps({
-            'material': random.choice(['Steel','Aluminum','Plastic','Composite','Copper']),
-            'operating_temp': f"{random.randint(-40,0)}C to {random.randint(50,150)}C",
-            'ip_rating': f"IP{random.choice([54,65,67,68])}",
-            'certifications': random.sample(['CE','UL','ISO9001','RoHS','REACH'], k=random.randint(1, 3))
-        }),
-        json.dumps({
-            'ship_class': random.choice(['Standard','Oversize','Hazmat','Fragile']),
-            'est_days': random.randint(1, 14),
-            'free_shipping_above': round(random.uniform(50, 500), 2)
-        }),
-        json.dumps({
-            'supplier_id': f"SUP-{random.randint(100,999)}",
-            'lead_time_days': random.randint(7, 90),
-            'moq': random.randint(1, 100),
-            'country': random.choice(COUNTRIES)
-        }),
-        json.dumps({
-            'title': f"Buy {subcat} from {brand}",
-            'keywords': random.sample(['industrial','tools','safety','electronics','parts'], k=3),
-            'og_description': f"Shop {brand} {subcat} at competitive prices."
-        }),
-        bytes(random.getrandbits(8) for _ in range(64)),
-        f"Internal: margin tier {random.choice(['A','B','C'])}, review pending" if random.random() > 0.6 else None,
-        random.choice(COUNTRIES),
-        f"{random.randint(1000,9999)}.{random.randint(10,99)}.{random.randint(10,99)}"
+        now - _choice(CREATED_AGES),
+        now.replace(tzinfo=None),
+        _sample(PRODUCT_TAGS, k=_randint(1, 4)),
+        _sample(COLORS, k=_randint(1, 4)),
+        [_choice(COMPATIBLE_SKUS) for _ in range(_randint(0, 3))],
+        [_randint(1, 20) for _ in range(_randint(1, 4))],
+        f'{{"material":{_choice(MATERIALS_JSON)},'
+        f'"operating_temp":"{_randint(-40,0)}C to {_randint(50,150)}C",'
+        f'"ip_rating":{_choice(IP_RATINGS_JSON)},'
+        f'"certifications":{dump_json(_sample(PRODUCT_CERTS, k=_randint(1, 3)))}}}',
+        f'{{"ship_class":{_choice(SHIP_CLASSES_JSON)},"est_days":{_randint(1, 14)},'
+        f'"free_shipping_above":{round(_uniform(50, 500), 2)!r}}}',
+        f'{{"supplier_id":"SUP-{_randint(100,999)}","lead_time_days":{_randint(7, 90)},'
+        f'"moq":{_randint(1, 100)},"country":{_choice(COUNTRIES_JSON)}}}',
+        f'{{"title":{seo_title},"keywords":{_choice(SEO_KEYWORD_LISTS)},'
+        f'"og_description":{seo_description}}}',
+        os.urandom(64),
+        _choice(INTERNAL_NOTES) if _random() > 0.6 else None,
+        _choice(COUNTRIES),
+        f"{_randint(1000,9999)}.{_randint(10,99)}.{_randint(10,99)}"
     )
 
 
+# =====================================================================================
+# Bulk load helpers
+# =====================================================================================
+def insert_columns(insert_sql: str) -> List[str]:
+    """Extract the target column names from a parameterized INSERT statement."""
+    head = insert_sql[:insert_sql.rindex('VALUES')]
+    column_list = head[head.rindex('(') + 1:head.rindex(')')]
+    return [col.strip() for col in column_list.split(',')]
+
+# Tables loaded with binary COPY. Every value their generators produce has a direct
+# binary form (Decimal, aware/naive datetimes, lists, bytes); the other tables
+# carry month INTERVALs and naive TIME WITH TIME ZONE values, so they stay on text COPY.
+BINARY_COPY_TABLES = {'sensor_readings', 'product_catalog'}
+
+def copy_statement(table_name: str, insert_sql: str, binary: bool = False) -> str:
+    """
+    Builds the COPY ... FROM STDIN statement matching a table's INSERT column list.
+
+    COPY streams a whole batch to the server as one data stream, so the rows skip
+    the per-statement parse/bind/execute cycle that executemany goes through.
+
+    Args:
+        table_name (str): The table being loaded.
+        insert_sql (str): The table's INSERT statement; its column list and order
+            match the tuples returned by the table's generator.
+        binary (bool): Use PostgreSQL's binary COPY format instead of text.
+
+    Returns:
+        str: The COPY statement.
+    """
+    sql = f"COPY {table_name} ({', '.join(insert_columns(insert_sql))}) FROM STDIN"
+    return sql + " (FORMAT BINARY)" if binary else sql
+
+class JsonbTextBinaryDumper(Dumper):
+    """
+    Binary COPY dumper for JSONB documents the generators have already serialized.
+
+    psycopg's own JSONB dumper serializes the object it is given, which would turn
+    finished JSON text into a quoted JSON string. This one only prepends the
+    one-byte JSONB format version. It is registered for lookups by OID only, so it
+    applies to COPY columns declared with set_types() and nothing else.
+    """
+    format = Format.BINARY
+    oid = psycopg.postgres.types['jsonb'].oid
+
+    def dump(self, obj: str) -> bytes:
+        return b"\x01" + obj.encode()
+
+def column_types(conn, table_name: str, columns: List[str]) -> List[int]:
+    """
+    Looks up the type OIDs of a table's COPY columns, for Copy.set_types().
+
+    CHAR(n) columns are declared as text: psycopg has no binary dumper for bpchar,
+    and both types share the same binary wire format.
+
+    Args:
+        conn (psycopg.Connection): The active PostgreSQL database connection object.
+        table_name (str): The table being loaded.
+        columns (List[str]): The COPY column list, in order.
+
+    Returns:
+        List[int]: One type OID per column.
+    """
+    with conn.cursor() as cur:
+        cur.execute("""
+            SELECT attname, atttypid FROM pg_attribute
+            WHERE attrelid = %s::regclass AND attnum > 0 AND NOT attisdropped
+        """, (table_name,))
+        types = dict(cur.fetchall())
+    bpchar, text = psycopg.postgres.types['bpchar'].oid, psycopg.postgres.types['text'].oid
+    return [text if types[col] == bpchar else types[col] for col in columns]
+
+def iter_rows(gen_fn, batch_start: int, batch_end: int):
+    """
+    Lazily generates the rows [batch_start, batch_end) of a table.
+
+    Args:
+        gen_fn (Callable[[int, datetime], tuple]): The table's row generator.
+        batch_start (int): Index of the first row.
+        batch_end (int): Index one past the last row.
+
+    Returns:
+        Iterator[tuple]: The rows, built one at a time as they are consumed.
+    """
+    # One clock read per batch; rows in a batch share the same "now"
+    now = datetime.now(timezone.utc)
+    return (gen_fn(i, now) for i in range(batch_start, batch_end))
+
+def produce_batches(gen_fn, total_records: int, batch_size: int, batches: queue.Queue):
+    """
+    Generates row batches on a background thread and hands them to the loader.
+
+    Building the next batch overlaps with the COPY of the current one, so a table
+    load takes roughly max(generation, load) time instead of their sum. A trailing
+    None marks the end of the table; an exception raised while generating is
+    forwarded through the queue so the consumer can re-raise it.
+
+    Args:
+        gen_fn (Callable[[int, datetime], tuple]): The table's row generator.
+        total_records (int): Number of rows to generate.
+        batch_size (int): Rows per batch.
+        batches (queue.Queue): Bounded queue shared with the consumer.
+    """
+    try:
+        for batch_start in range(0, total_records, batch_size):
+            batch_end = min(batch_start + batch_size, total_records)
+            batches.put(list(iter_rows(gen_fn, batch_start, batch_end)))
+    except Exception as e:
+        batches.put(e)
+        return
+    batches.put(None)
+
+def drain_batches(batches: queue.Queue):
+    """
+    Yields (rows, row_count) for each batch queued by produce_batches.
+
+    Args:
+        batches (queue.Queue): The queue filled by produce_batches.
+
+    Raises:
+        Exception: Any exception the producer thread forwarded through the queue.
+    """
+    while (batch := batches.get()) is not None:
+        if isinstance(batch, Exception):
+            raise batch
+        yield batch, len(batch)
+
+def stream_batches(gen_fn, total_records: int, batch_size: int):
+    """
+    Yields (rows, row_count) with rows as lazy generators, for loads without read-ahead.
+
+    Each row is built only when COPY writes it, so no batch is ever held in memory.
+
+    Args:
+        gen_fn (Callable[[int, datetime], tuple]): The table's row generator.
+        total_records (int): Number of rows to generate.
+        batch_size (int): Rows per batch.
+    """
+    for batch_start in range(0, total_records, batch_size):
+        batch_end = min(batch_start + batch_size, total_records)
+        yield iter_rows(gen_fn, batch_start, batch_end), batch_end - batch_start
+
+
 # =====================================================================================
 # Runner
 # =====================================================================================
 TABLE_CONFIG = [
-    ('invoices',        INVOICES_DDL,  INVOICES_INSERT,  gen_invoice),
-    ('employees',       EMPLOYEES_DDL, EMPLOYEES_INSERT, gen_employee),
-    ('sensor_readings', SENSOR_DDL,    SENSOR_INSERT,    gen_sensor_reading),
-    ('product_catalog', CATALOG_DDL,   CATALOG_INSERT,   gen_product),
+    ('invoices',        INVOICES_DDL,  INVOICES_IDX,  INVOICES_INSERT,  gen_invoice),
+    ('employees',       EMPLOYEES_DDL, EMPLOYEES_IDX, EMPLOYEES_INSERT, gen_employee),
+    ('sensor_readings', SENSOR_DDL,    SENSOR_IDX,    SENSOR_INSERT,    gen_sensor_reading),
+    ('product_catalog', CATALOG_DDL,   CATALOG_IDX,   CATALOG_INSERT,   gen_product),
 ]
 
-def run(connection_string: str, total_records: int = 1000, batch_size: int = 100):
-    with psycopg.connect(connection_string) as conn:
-        for table_name, ddl, insert_sql, gen_fn in TABLE_CONFIG:
-            print(f"\n{'='*60}")
-            print(f"  Processing table: {table_name}")
-            print(f"{'='*60}")
-
-            # Ensure a clean table exists
-            ensure_table(conn, table_name, ddl)
+def create_indexes(conn, table_name: str, indexes: List[str]):
+    """
+    Builds a table's secondary indexes and UNIQUE keys once its rows are loaded,
+    then analyzes it.
 
-            # Insert data
-            inserted = 0
-            for batch_start in range(0, total_records, batch_size):
-                batch_end = min(batch_start + batch_size, total_records)
-                batch = [gen_fn(i) for i in range(batch_start, batch_end)]
+    Each index is built with one sort over the loaded rows instead of being
+    maintained row by row during the COPY. maintenance_work_mem is raised for this
+    transaction only, so the sorts can stay in memory. ANALYZE runs in the same
+    transaction, so the planner has statistics before anything queries the rows.
 
-                with conn.cursor() as cur:
-                    cur.executemany(insert_sql, batch) # type: ignore
-                conn.commit()
+    Args:
+        conn (psycopg.Connection): The active PostgreSQL database connection object.
+        table_name (str): The table the indexes belong to.
+        indexes (List[str]): CREATE INDEX / ADD CONSTRAINT ... UNIQUE statements for the table.
+    """
+    print(f"  Creating {len(indexes)} indexes on {table_name}...")
+    with conn.cursor() as cur:
+        cur.execute("SET LOCAL maintenance_work_mem = '256MB'")
+        for stmt in indexes:
+            cur.execute(stmt)
+        cur.execute(f"ANALYZE {table_name}")
+    conn.commit()
+
+def seed_worker():
+    """Reseeds a loader process; forked workers would otherwise share one random state."""
+    random.seed()
+
+def load_table(connection_string: str, table_config: tuple, total_records: int,
+               batch_size: int, prefetch_batches: int = 2, commit_every: int = 10,
+               use_copy: bool = True) -> int:
+    """
+    Creates one table and loads its generated rows over a dedicated connection.
 
-                inserted += len(batch)
-                print(f"  [{table_name}] Inserted {inserted}/{total_records}")
+    Rows are generated on a background thread and streamed to the server with COPY,
+    one batch per COPY. With `prefetch_batches=0` there is no background thread and
+    rows are generated lazily while COPY consumes them. With `use_copy=False` each
+    batch is sent as a pipelined executemany() of the table's INSERT instead, for
+    servers or tables where COPY cannot be used. The session runs with
+    synchronous_commit off, and the transaction is committed every `commit_every`
+    batches and once more when the table is complete. The secondary indexes are
+    built and the table is analyzed after the load.
 
-            print(f"  Completed {table_name}: {inserted} records total.")
+    Args:
+        connection_string (str): PostgreSQL connection URI.
+        table_config (tuple): One TABLE_CONFIG entry (name, DDL, indexes, INSERT, generator).
+        total_records (int): Number of rows to load.
+        batch_size (int): Rows per COPY batch.
+        prefetch_batches (int): How many batches may be generated ahead of the load;
+            0 streams rows lazily without read-ahead.
+        commit_every (int): Number of batches per transaction.
+        use_copy (bool): Load with COPY; False falls back to pipelined INSERTs.
+
+    Returns:
+        int: The number of rows loaded.
+    """
+    table_name, ddl, indexes, insert_sql, gen_fn = table_config
+    with psycopg.connect(connection_string) as conn:
+        print(f"  Processing table: {table_name}")
+        # Seed data can be regenerated, so commits need not wait for the WAL flush;
+        # warnings-only also drops the DROP ... IF EXISTS notice on a fresh database
+        conn.execute("SET synchronous_commit = off; SET client_min_messages = warning")
+
+        # Ensure a clean table exists. It is created as a regular (logged) table:
+        # loading it UNLOGGED and then running ALTER TABLE ... SET LOGGED saves no
+        # WAL unless wal_level=minimal, because SET LOGGED rewrites the table and
+        # writes all of it to the WAL.
+        ensure_table(conn, table_name, ddl)
+
+        producer = None
+        if prefetch_batches > 0:
+            # Bounded queue: at most `prefetch_batches` batches are generated ahead of the load
+            batches = queue.Queue(maxsize=prefetch_batches)
+            producer = threading.Thread(target=produce_batches, daemon=True,
+                                        args=(gen_fn, total_records, batch_size, batches))
+            producer.start()
+            pending = drain_batches(batches)
+        else:
+            # No read-ahead: rows flow from the generator straight into COPY, so no
+            # batch is ever materialized (lowest memory, no overlap)
+            pending = stream_batches(gen_fn, total_records, batch_size)
+
+        # Insert data over one cursor per table. Commits (and their WAL flushes)
+        # happen every `commit_every` batches and once at the end of the table.
+        binary = use_copy and table_name in BINARY_COPY_TABLES
+        copy_sql = copy_statement(table_name, insert_sql, binary)
+        if binary:
+            conn.adapters.register_dumper(None, JsonbTextBinaryDumper)
+            copy_types = column_types(conn, table_name, insert_columns(insert_sql))
+        inserted = 0
+        with conn.cursor() as cur:
+            batch_idx = 0
+            for rows, row_count in pending:
+                if use_copy:
+                    with cur.copy(copy_sql) as copy:
+                        if binary:
+                            copy.set_types(copy_types)
+                        for row in rows:
+                            copy.write_row(row)
+                else:
+                    # psycopg runs executemany() in pipeline mode: the Bind/Execute
+                    # messages for the whole batch go out before a single Sync
+                    cur.executemany(insert_sql, rows)
+                batch_idx += 1
+                inserted += row_count
+                # Progress is reported with each commit rather than after every batch
+                if batch_idx % max(commit_every, 1) == 0:
+                    conn.commit()
+                    print(f"  [{table_name}] Inserted {inserted}/{total_records}")
+        conn.commit()
+        if producer is not None:
+            producer.join()
+        if batch_idx % max(commit_every, 1):
+            print(f"  [{table_name}] Inserted {inserted}/{total_records}")
+
+        # The post-load DDL returns no rows, so it is queued in one pipeline and sent
+        # in a single round trip, committed together with the index builds.
+        with conn.pipeline():
+            create_indexes(conn, table_name, indexes)
+        print(f"  Completed {table_name}: {inserted} records total.")
+    return inserted
+
+def run(connection_string: str, total_records: int = 1000, batch_size: int = 100,
+        prefetch_batches: int = 2, commit_every: int = 10, use_copy: bool = True):
+    # The tables are independent, so each one is loaded by its own process (and GIL)
+    # on its own connection
+    print(f"\n{'='*60}")
+    print(f"  Loading {len(TABLE_CONFIG)} tables in parallel")
+    print(f"{'='*60}")
+    with ProcessPoolExecutor(max_workers=len(TABLE_CONFIG), initializer=seed_worker) as pool:
+        futures = [pool.submit(load_table, connection_string, table_config, total_records,
+                               batch_size, prefetch_batches, commit_every, use_copy)
+                   for table_config in TABLE_CONFIG]
+        for future in futures:
+            future.result()
 
     print(f"\nAll tables populated successfully.")
 
@@ -763,7 +1110,7 @@ def main():
     run(
         connection_string=connection_string,
         total_records=5000,   # per table
-        batch_size=500
+        batch_size=5000       # rows per COPY; COPY has no bind-parameter cap
     )
 
 if __name__ == "__main__":